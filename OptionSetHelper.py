@@ -8,25 +8,164 @@ Authentication via OAuth2 client credentials flow with token caching.
 
 from __future__ import annotations
 
+import asyncio
+import email.utils
+import hashlib
 import json
 import logging
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional C JSON encoder – noticeably faster on large batches
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
 logger = logging.getLogger("OptionSetHelper")
 
+_JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialise ``obj`` to compact UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _retry_after_seconds(value: str | None, default: float = 1.0) -> float:
+    """Seconds to wait for a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _default_headers(token: str) -> dict[str, str]:
+    """Default Dataverse Web API request headers for a bearer token."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": _JSON_CONTENT_TYPE,
+        "OData-MaxVersion": "4.0",
+        "OData-Version": "4.0",
+    }
+
+
+def _requests_response(resp: Any) -> requests.Response:
+    """Copy a (fully read) ``httpx.Response`` into a ``requests.Response``."""
+    out = requests.Response()
+    out.status_code = resp.status_code
+    out._content = resp.content
+    out.headers.update(resp.headers)
+    out.url = str(resp.url)
+    out.reason = resp.reason_phrase
+    out.encoding = resp.encoding
+    return out
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Constant pieces of the multipart $batch body (see _build_batch_body)
+_BATCH_CHANGESET_START = b"Content-Type: multipart/mixed;boundary=changeset_001\r\n\r\n"
+_BATCH_PART_HEADER = (
+    b"--changeset_001\r\n"
+    b"Content-Type: application/http\r\n"
+    b"Content-Transfer-Encoding: binary\r\n"
+    b"Content-ID: "
+)
+_BATCH_CHANGESET_END = b"--changeset_001--\r\n"
+
+# Status line of each sub-response inside a $batch response
+_HTTP_STATUS_RE = re.compile(rb"^[ \t]*HTTP/1\.1 (\d{3})(?: ([^\r\n]*))?", re.MULTILINE)
+
+
+def _scope_fields(
+    option_set_name: str,
+    entity_logical_name: str | None,
+    attribute_logical_name: str | None,
+) -> dict[str, str]:
+    """Return the payload keys that identify a global or local OptionSet."""
+    if entity_logical_name and attribute_logical_name:
+        return {
+            "EntityLogicalName": entity_logical_name,
+            "AttributeLogicalName": attribute_logical_name,
+        }
+    return {"OptionSetName": option_set_name}
+
+
+_DEBUG_DUMP_LIMIT = 2048  # bytes of a failed $batch request/response to log
+
+
+def _log_batch_failure(body: bytes, response: bytes) -> None:
+    """Dump the head of a failed $batch exchange at DEBUG level."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "Batch request body:\n%s",
+        body[:_DEBUG_DUMP_LIMIT].decode("utf-8", "replace"),
+    )
+    logger.debug(
+        "Batch response:\n%s",
+        response[:_DEBUG_DUMP_LIMIT].decode("utf-8", "replace"),
+    )
+
+
+class _Throttled:
+    """
+    Wrap a progress callback so it fires at most once per ``min_interval``
+    seconds.  Intermediate messages are coalesced (only the latest one is
+    kept); pass ``force=True`` to deliver a message immediately.
+    """
+
+    __slots__ = ("_callback", "_min_interval", "_last_ts", "_pending_msg", "_lock")
+
+    def __init__(self, callback, min_interval: float = 0.1):
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_ts = 0.0
+        self._pending_msg: str | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, msg: str, *, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_ts < self._min_interval:
+                self._pending_msg = msg
+                return
+            self._last_ts = now
+            self._pending_msg = None
+        self._callback(msg)
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptionItem:
     """Represents a single option (label + integer value) in an OptionSet."""
     label: str
@@ -41,20 +180,10 @@ class OptionItem:
         attribute_logical_name: str | None = None,
     ) -> dict:
         """Return the JSON body for an InsertOptionValue call."""
-        payload: dict[str, Any] = {
-            "Label": {
-                "LocalizedLabels": [
-                    {"Label": self.label, "LanguageCode": language_code}
-                ]
-            },
-            "Value": self.value,
-        }
-        if entity_logical_name and attribute_logical_name:
-            payload["EntityLogicalName"] = entity_logical_name
-            payload["AttributeLogicalName"] = attribute_logical_name
-        else:
-            payload["OptionSetName"] = option_set_name
-        return payload
+        return self._insert_payload(
+            language_code,
+            _scope_fields(option_set_name, entity_logical_name, attribute_logical_name),
+        )
 
     def to_update_payload(
         self,
@@ -66,21 +195,11 @@ class OptionItem:
         attribute_logical_name: str | None = None,
     ) -> dict:
         """Return the JSON body for an UpdateOptionValue call."""
-        payload: dict[str, Any] = {
-            "Label": {
-                "LocalizedLabels": [
-                    {"Label": self.label, "LanguageCode": language_code}
-                ]
-            },
-            "Value": self.value,
-            "MergeLabels": merge_labels,
-        }
-        if entity_logical_name and attribute_logical_name:
-            payload["EntityLogicalName"] = entity_logical_name
-            payload["AttributeLogicalName"] = attribute_logical_name
-        else:
-            payload["OptionSetName"] = option_set_name
-        return payload
+        return self._update_payload(
+            language_code,
+            merge_labels,
+            _scope_fields(option_set_name, entity_logical_name, attribute_logical_name),
+        )
 
     def to_delete_payload(
         self,
@@ -90,13 +209,39 @@ class OptionItem:
         attribute_logical_name: str | None = None,
     ) -> dict:
         """Return the JSON body for a DeleteOptionValue call."""
-        payload: dict[str, Any] = {"Value": self.value}
-        if entity_logical_name and attribute_logical_name:
-            payload["EntityLogicalName"] = entity_logical_name
-            payload["AttributeLogicalName"] = attribute_logical_name
-        else:
-            payload["OptionSetName"] = option_set_name
-        return payload
+        return self._delete_payload(
+            _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        )
+
+    # Bulk paths resolve the target scope once (see _scope_fields) and
+    # reuse it for every item instead of re-deciding it per option.
+    def _insert_payload(self, language_code: int, scope: dict[str, str]) -> dict:
+        return {
+            "Label": {
+                "LocalizedLabels": [
+                    {"Label": self.label, "LanguageCode": language_code}
+                ]
+            },
+            "Value": self.value,
+            **scope,
+        }
+
+    def _update_payload(
+        self, language_code: int, merge_labels: bool, scope: dict[str, str]
+    ) -> dict:
+        return {
+            "Label": {
+                "LocalizedLabels": [
+                    {"Label": self.label, "LanguageCode": language_code}
+                ]
+            },
+            "Value": self.value,
+            "MergeLabels": merge_labels,
+            **scope,
+        }
+
+    def _delete_payload(self, scope: dict[str, str]) -> dict:
+        return {"Value": self.value, **scope}
 
     def to_option_metadata(self, language_code: int = 1033) -> dict:
         """Return the OptionMetadata shape used in the POST create body."""
@@ -111,7 +256,7 @@ class OptionItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Outcome of a single sub-request inside a $batch."""
     index: int
@@ -122,7 +267,7 @@ class BatchResult:
     detail: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchReport:
     """Aggregated outcome of a $batch call."""
     total: int = 0
@@ -138,6 +283,17 @@ class DataverseOptionSetService:
     """General-purpose Dataverse OptionSet management service."""
 
     API_VERSION = "v9.2"
+    MAX_BATCH_SIZE = 1000      # Dataverse limit of requests per $batch
+    MAX_BATCH_ATTEMPTS = 3     # tries per chunk when throttled (429 / 503)
+    SEARCH_INDEX_TTL = 60.0    # seconds a label search index stays valid
+    OPTIONS_CACHE_TTL = 30.0   # seconds fetched option lists are reused
+
+    # Tokens shared by every service instance talking to the same tenant /
+    # app registration / scope: key -> (access_token, expiry epoch seconds)
+    _TOKEN_CACHE: dict[tuple[str, str, str, str], tuple[str, float]] = {}
+    # Guards _TOKEN_CACHE and each instance's token fields; class-level so
+    # instances sharing credentials don't race on the shared cache
+    _TOKEN_LOCK = threading.Lock()
 
     def __init__(
         self,
@@ -145,6 +301,9 @@ class DataverseOptionSetService:
         tenant_id: str,
         client_id: str,
         client_secret: str,
+        *,
+        transport: Literal["requests", "httpx"] = "requests",
+        pool_maxsize: int = 32,
     ):
         self.environment_url = environment_url.rstrip("/")
         self.tenant_id = tenant_id
@@ -153,39 +312,160 @@ class DataverseOptionSetService:
 
         self._token: str | None = None
         self._token_expiry: float = 0.0  # epoch seconds
+        self._cached_headers: dict[str, str] | None = None
+        # definition URL -> (ETag, JSON body) for conditional GETs
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
+        # (name, entity, attribute) -> (fetched at, options)
+        self._optionset_cache: dict[tuple, tuple[float, list[dict]]] = {}
+        # language_code -> (built at, [(label lowercased, definition), ...])
+        self._label_index: dict[int, tuple[float, list[tuple[str, dict]]]] = {}
+        # guards the three caches above
+        self._cache_lock = threading.RLock()
+        # bumped by invalidate_optionset_cache so in-flight fetches don't
+        # write back data that was invalidated meanwhile
+        self._cache_generation = 0
+        self._token_key = (
+            tenant_id,
+            client_id,
+            hashlib.sha256(client_secret.encode("utf-8")).hexdigest(),
+            f"{self.environment_url}/.default",
+        )
+
+        # One pooled session for every call (login + Dataverse host) so
+        # keep-alive connections are reused instead of a new TLS handshake
+        # per request.  ``pool_maxsize`` should be at least the number of
+        # threads sending requests concurrently, or connections get dropped.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            # The adapter is the only retry layer for reads.  POSTs are not
+            # replayed here: a $batch that timed out at a gateway (502/504)
+            # may already be committed, and resending it would duplicate
+            # options.  Throttled $batch POSTs (429/503, never executed) are
+            # retried by _post_batch instead.  Exhausted retries hand back
+            # the last response (instead of raising RetryError) so _request
+            # still sees it.  The httpx transport (see _send) has no retry
+            # layer at all.
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+
+        # Optional HTTP/2 transport: concurrent $batch chunks are multiplexed
+        # over a single TLS connection instead of one connection each.
+        self._client: Any = None
+        if transport == "httpx":
+            try:
+                import httpx
+
+                self._client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                    timeout=httpx.Timeout(60.0),
+                )
+            except ImportError:
+                logger.warning(
+                    "httpx[http2] not installed – falling back to the requests transport"
+                )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._client is not None:
+            self._client.close()
+        self._session.close()
+
+    def __enter__(self) -> DataverseOptionSetService:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Authentication
     # ------------------------------------------------------------------
-    def get_bearer_token(self, *, force_new: bool = False) -> str:
+    def get_bearer_token(self, *, force_new: bool = False, min_ttl: float = 0.0) -> str:
         """
         Obtain a Bearer token via OAuth2 client-credentials.
 
         * Cached token is reused if still valid (with 60 s margin).
-        * ``force_new=True`` always fetches a fresh token (use for batch).
+        * ``min_ttl`` additionally requires that many seconds of validity.
+        * ``force_new=True`` always fetches a fresh token.
+
+        Safe to call from several threads: only one of them hits the token
+        endpoint, the others pick up the token it stored.
         """
         now = time.time()
-        if not force_new and self._token and now < self._token_expiry:
+        if not force_new and self._token and now < self._token_expiry - min_ttl:
             logger.debug("Reusing cached token (expires in %.0f s)", self._token_expiry - now)
             return self._token
 
-        token_url = (
-            f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
-        )
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": f"{self.environment_url}/.default",
-        }
-        resp = requests.post(token_url, data=data, timeout=30)
-        resp.raise_for_status()
-        body = resp.json()
-        self._token = body["access_token"]
-        # Cache with a 60 s safety margin
-        self._token_expiry = now + int(body.get("expires_in", 3600)) - 60
-        logger.debug("Obtained new bearer token")
-        return self._token  # type: ignore[return-value]
+        with self._TOKEN_LOCK:
+            now = time.time()
+            if not force_new:
+                # Another thread (or service instance) may have refreshed it
+                if self._token and now < self._token_expiry - min_ttl:
+                    return self._token
+                cached = self._TOKEN_CACHE.get(self._token_key)
+                if cached and now < cached[1] - min_ttl:
+                    self._set_token(*cached)
+                    logger.debug("Reusing shared token (expires in %.0f s)", cached[1] - now)
+                    return self._token
+
+            token_url = (
+                f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
+            )
+            data = {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": self._token_key[3],
+            }
+            resp = self._send("POST", token_url, data=data, timeout=30)
+            resp.raise_for_status()
+            body = _loads(resp.content)
+            # Cache with a 60 s safety margin
+            self._set_token(
+                body["access_token"], now + int(body.get("expires_in", 3600)) - 60
+            )
+            self._TOKEN_CACHE[self._token_key] = (self._token, self._token_expiry)
+            logger.debug("Obtained new bearer token")
+            return self._token  # type: ignore[return-value]
+
+    def _ensure_token_valid(self, min_ttl: float = 120.0) -> str:
+        """
+        Return the cached token unless it expires within ``min_ttl`` seconds,
+        in which case (and only then) a new one is fetched.
+        """
+        return self.get_bearer_token(min_ttl=min_ttl)
+
+    @property
+    def token_expires_at(self) -> float:
+        """Epoch seconds at which the cached token is considered expired (0 if none)."""
+        return self._token_expiry
+
+    def _set_token(self, token: str, expiry: float) -> None:
+        """Store a token and pre-build the default request headers for it."""
+        self._cached_headers = _default_headers(token)
+        self._token = token
+        self._token_expiry = expiry
+
+    def _invalidate_token(self) -> None:
+        """Drop the cached token (e.g. after the server rejected it)."""
+        with self._TOKEN_LOCK:
+            self._token = None
+            self._token_expiry = 0.0
+            self._cached_headers = None
+            self._TOKEN_CACHE.pop(self._token_key, None)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -194,32 +474,170 @@ class DataverseOptionSetService:
     def _base_url(self) -> str:
         return f"{self.environment_url}/api/data/{self.API_VERSION}"
 
-    def _headers(self, *, content_type: str = "application/json; charset=utf-8") -> dict:
-        return {
-            "Authorization": f"Bearer {self.get_bearer_token()}",
-            "Content-Type": content_type,
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-        }
+    def _headers(self, *, content_type: str = _JSON_CONTENT_TYPE) -> dict:
+        """
+        Return the request headers for the current token.
+
+        The default dict is shared between calls – treat it as read-only;
+        a copy is returned when ``content_type`` is overridden.
+        """
+        token = self.get_bearer_token()
+        # Read the shared dict once: another thread's _invalidate_token may
+        # reset it (or a refresh replace it) after get_bearer_token returned
+        headers = self._cached_headers
+        if headers is None or headers["Authorization"] != f"Bearer {token}":
+            headers = _default_headers(token)
+        if content_type != _JSON_CONTENT_TYPE:
+            headers = {**headers, "Content-Type": content_type}
+        return headers
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Issue one HTTP request on the configured transport.
+
+        Takes ``requests``-style keyword arguments; with the httpx client a
+        raw ``data`` body (bytes / str) is passed on as ``content``.  Either
+        way callers get a ``requests.Response`` and ``requests`` exceptions
+        (``raise_for_status`` raises ``requests.HTTPError``).
+        """
+        if self._client is None:
+            return self._session.request(method, url, **kwargs)
+        import httpx
+
+        data = kwargs.get("data")
+        if isinstance(data, (bytes, str)):
+            kwargs["content"] = kwargs.pop("data")
+        try:
+            resp = self._client.request(method, url, **kwargs)
+        except httpx.TimeoutException as exc:
+            raise requests.Timeout(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+        return _requests_response(resp)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a Dataverse request through the pooled session.
+
+        A 401 means the token was revoked or expired early: the cached
+        token is dropped and the request is retried once with a new one.
+        """
+        resp = self._send(method, url, **kwargs)
+        if resp.status_code == 401:
+            logger.debug("HTTP 401 from %s – refreshing token and retrying once", url)
+            self._invalidate_token()
+            headers = dict(kwargs.get("headers") or {})
+            headers["Authorization"] = f"Bearer {self.get_bearer_token()}"
+            kwargs["headers"] = headers
+            resp = self._send(method, url, **kwargs)
+        return resp
 
     # ------------------------------------------------------------------
     # READ / LIST
     # ------------------------------------------------------------------
-    def get_global_optionset(self, name: str) -> dict | None:
-        """Retrieve a global OptionSet definition by its schema name."""
-        url = f"{self._base_url}/GlobalOptionSetDefinitions(Name='{name}')"
-        resp = requests.get(url, headers=self._headers(), timeout=30)
+    def _global_optionset_url(self, name: str) -> str:
+        return f"{self._base_url}/GlobalOptionSetDefinitions(Name='{name}')"
+
+    def _local_optionset_url(
+        self, entity_logical_name: str, attribute_logical_name: str
+    ) -> str:
+        return (
+            f"{self._base_url}/EntityDefinitions(LogicalName='{entity_logical_name}')"
+            f"/Attributes(LogicalName='{attribute_logical_name}')"
+            f"/Microsoft.Dynamics.CRM.PicklistAttributeMetadata"
+            f"?$expand=OptionSet"
+        )
+
+    def _get_definition(self, url: str) -> dict | None:
+        """
+        GET an OptionSet definition, revalidating any cached copy with
+        ``If-None-Match`` so an unchanged definition isn't downloaded again.
+        """
+        with self._cache_lock:
+            cached = self._etag_cache.get(url)
+            generation = self._cache_generation
+        headers = self._headers()
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        resp = self._request("GET", url, headers=headers, timeout=30)
+        if resp.status_code == 304 and cached:
+            logger.debug("Definition not modified, using cached copy: %s", url)
+            return cached[1]
         if resp.status_code == 404:
+            with self._cache_lock:
+                self._etag_cache.pop(url, None)
             return None
         resp.raise_for_status()
-        return resp.json()
+        data = _loads(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                # An invalidation while the GET was in flight wins
+                if generation == self._cache_generation:
+                    self._etag_cache[url] = (etag, data)
+        return data
+
+    def invalidate_optionset_cache(
+        self,
+        option_set_name: str | None = None,
+        *,
+        entity_logical_name: str | None = None,
+        attribute_logical_name: str | None = None,
+    ) -> None:
+        """
+        Forget cached metadata for one OptionSet (global by name, or local by
+        entity + attribute), or for every OptionSet when called without
+        arguments.  The label search index is dropped either way.  Mutating
+        service methods call this automatically.
+        """
+        if entity_logical_name and attribute_logical_name:
+            url = self._local_optionset_url(entity_logical_name, attribute_logical_name)
+        elif option_set_name:
+            url = self._global_optionset_url(option_set_name)
+        else:
+            with self._cache_lock:
+                self._cache_generation += 1
+                self._etag_cache.clear()
+                self._optionset_cache.clear()
+                self._label_index.clear()
+            return
+        key = self._options_cache_key(
+            option_set_name, entity_logical_name, attribute_logical_name
+        )
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._etag_cache.pop(url, None)
+            self._optionset_cache.pop(key, None)
+            self._label_index.clear()
+
+    @staticmethod
+    def _options_cache_key(
+        option_set_name: str | None,
+        entity_logical_name: str | None,
+        attribute_logical_name: str | None,
+    ) -> tuple:
+        # A local OptionSet is identified by entity + attribute alone.
+        if entity_logical_name and attribute_logical_name:
+            return (None, entity_logical_name, attribute_logical_name)
+        return (option_set_name, None, None)
+
+    def get_global_optionset(self, name: str) -> dict | None:
+        """Retrieve a global OptionSet definition by its schema name."""
+        return self._get_definition(self._global_optionset_url(name))
 
     def list_global_optionsets(self) -> list[dict]:
         """List all global OptionSet definitions."""
+        return _loads(self.list_global_optionsets_raw()).get("value", [])
+
+    def list_global_optionsets_raw(self) -> bytes:
+        """
+        Return the undecoded ``GlobalOptionSetDefinitions`` response body,
+        for callers that parse the ``value`` array incrementally.
+        """
         url = f"{self._base_url}/GlobalOptionSetDefinitions"
-        resp = requests.get(url, headers=self._headers(), timeout=60)
+        resp = self._request("GET", url, headers=self._headers(), timeout=60)
         resp.raise_for_status()
-        return resp.json().get("value", [])
+        return resp.content
 
     def search_global_optionsets_by_label(
         self, search_text: str, language_code: int = 1033
@@ -228,37 +646,51 @@ class DataverseOptionSetService:
         Return global OptionSets whose *DisplayName* contains ``search_text``
         (case-insensitive substring match done client-side because the
         Dataverse OData endpoint doesn't support $filter on
-        DisplayName directly).
-        """
-        all_sets = self.list_global_optionsets()
-        results = []
-        for os_def in all_sets:
-            display = os_def.get("DisplayName", {})
-            localized = display.get("LocalizedLabels", [])
-            for lbl in localized:
-                if (
-                    lbl.get("LanguageCode") == language_code
-                    and search_text.lower() in lbl.get("Label", "").lower()
-                ):
-                    results.append(os_def)
-                    break
-        return results
+        DisplayName directly).  The lowercased labels are indexed once and
+        reused for ``SEARCH_INDEX_TTL`` seconds.
+        """
+        needle = search_text.lower()
+        return [
+            os_def
+            for label_lc, os_def in self._get_label_index(language_code)
+            if needle in label_lc
+        ]
+
+    def _get_label_index(self, language_code: int) -> list[tuple[str, dict]]:
+        """
+        Return ``(lowercased display label, definition)`` pairs for every
+        global OptionSet, rebuilt at most every ``SEARCH_INDEX_TTL`` seconds.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._label_index.get(language_code)
+            generation = self._cache_generation
+        if cached and now - cached[0] < self.SEARCH_INDEX_TTL:
+            return cached[1]
+
+        index: list[tuple[str, dict]] = []
+        for os_def in self.list_global_optionsets():
+            localized = os_def.get("DisplayName", {}).get("LocalizedLabels", [])
+            labels = [
+                lbl.get("Label", "").lower()
+                for lbl in localized
+                if lbl.get("LanguageCode") == language_code
+            ]
+            if labels:
+                index.append(("\n".join(labels), os_def))
+        with self._cache_lock:
+            # An invalidation while the list was being fetched wins
+            if generation == self._cache_generation:
+                self._label_index[language_code] = (now, index)
+        return index
 
     def get_local_optionset(
         self, entity_logical_name: str, attribute_logical_name: str
     ) -> dict | None:
         """Retrieve a local (entity-scoped) OptionSet attribute definition."""
-        url = (
-            f"{self._base_url}/EntityDefinitions(LogicalName='{entity_logical_name}')"
-            f"/Attributes(LogicalName='{attribute_logical_name}')"
-            f"/Microsoft.Dynamics.CRM.PicklistAttributeMetadata"
-            f"?$expand=OptionSet"
+        return self._get_definition(
+            self._local_optionset_url(entity_logical_name, attribute_logical_name)
         )
-        resp = requests.get(url, headers=self._headers(), timeout=30)
-        if resp.status_code == 404:
-            return None
-        resp.raise_for_status()
-        return resp.json()
 
     def get_optionset_options(
         self,
@@ -270,17 +702,30 @@ class DataverseOptionSetService:
         """
         Return the current options of a global or local OptionSet.
         Useful for duplicate detection before insert.
+
+        Results are reused for ``OPTIONS_CACHE_TTL`` seconds; mutating
+        methods drop the entry via ``invalidate_optionset_cache``.
         """
+        key = self._options_cache_key(
+            option_set_name, entity_logical_name, attribute_logical_name
+        )
+        with self._cache_lock:
+            cached = self._optionset_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.OPTIONS_CACHE_TTL:
+                return cached[1]
+            generation = self._cache_generation
+
         if entity_logical_name and attribute_logical_name:
             data = self.get_local_optionset(entity_logical_name, attribute_logical_name)
-            if not data:
-                return []
-            return data.get("OptionSet", {}).get("Options", [])
+            options = data.get("OptionSet", {}).get("Options", []) if data else []
         else:
             data = self.get_global_optionset(option_set_name)
-            if not data:
-                return []
-            return data.get("Options", [])
+            options = data.get("Options", []) if data else []
+
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._optionset_cache[key] = (time.monotonic(), options)
+        return options
 
     def get_existing_values(
         self,
@@ -288,14 +733,14 @@ class DataverseOptionSetService:
         *,
         entity_logical_name: str | None = None,
         attribute_logical_name: str | None = None,
-    ) -> set[int]:
-        """Return a set of all existing option *Values* for fast lookup."""
+    ) -> frozenset[int]:
+        """Return a frozenset of all existing option *Values* for fast lookup."""
         options = self.get_optionset_options(
             option_set_name,
             entity_logical_name=entity_logical_name,
             attribute_logical_name=attribute_logical_name,
         )
-        return {opt["Value"] for opt in options if "Value" in opt}
+        return frozenset(opt["Value"] for opt in options if "Value" in opt)
 
     def get_existing_labels(
         self,
@@ -351,13 +796,15 @@ class DataverseOptionSetService:
             "OptionSetType": option_set_type,
             "Options": [o.to_option_metadata(language_code) for o in options],
         }
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             url,
             headers=self._headers(),
-            json=body,
+            data=_json_bytes(body),
             timeout=60,
         )
         resp.raise_for_status()
+        self.invalidate_optionset_cache(name)
         return resp
 
     # ------------------------------------------------------------------
@@ -380,8 +827,15 @@ class DataverseOptionSetService:
             entity_logical_name=entity_logical_name,
             attribute_logical_name=attribute_logical_name,
         )
-        resp = requests.post(url, headers=self._headers(), json=payload, timeout=30)
+        resp = self._request(
+            "POST", url, headers=self._headers(), data=_json_bytes(payload), timeout=30
+        )
         resp.raise_for_status()
+        self.invalidate_optionset_cache(
+            option_set_name,
+            entity_logical_name=entity_logical_name,
+            attribute_logical_name=attribute_logical_name,
+        )
         return resp
 
     def update_option(
@@ -403,8 +857,15 @@ class DataverseOptionSetService:
             entity_logical_name=entity_logical_name,
             attribute_logical_name=attribute_logical_name,
         )
-        resp = requests.post(url, headers=self._headers(), json=payload, timeout=30)
+        resp = self._request(
+            "POST", url, headers=self._headers(), data=_json_bytes(payload), timeout=30
+        )
         resp.raise_for_status()
+        self.invalidate_optionset_cache(
+            option_set_name,
+            entity_logical_name=entity_logical_name,
+            attribute_logical_name=attribute_logical_name,
+        )
         return resp
 
     def delete_option(
@@ -422,8 +883,15 @@ class DataverseOptionSetService:
             entity_logical_name=entity_logical_name,
             attribute_logical_name=attribute_logical_name,
         )
-        resp = requests.post(url, headers=self._headers(), json=payload, timeout=30)
+        resp = self._request(
+            "POST", url, headers=self._headers(), data=_json_bytes(payload), timeout=30
+        )
         resp.raise_for_status()
+        self.invalidate_optionset_cache(
+            option_set_name,
+            entity_logical_name=entity_logical_name,
+            attribute_logical_name=attribute_logical_name,
+        )
         return resp
 
     # ------------------------------------------------------------------
@@ -434,38 +902,37 @@ class DataverseOptionSetService:
         action: str,
         payloads: list[dict],
         boundary: str,
-    ) -> str:
+    ) -> bytes:
         """
-        Build an OData $batch multipart body.
+        Build an OData $batch multipart body, already UTF-8 encoded.
 
         ``action`` is one of: InsertOptionValue, UpdateOptionValue,
         DeleteOptionValue.
+
+        Note: the Dataverse Web API (OData 4.0) only accepts
+        ``multipart/mixed`` batches – the OData 4.01 JSON batch format
+        (``{"requests": [...]}``) is rejected, so it can't be used here.
         """
-        CRLF = "\r\n"
-        lines: list[str] = []
-        lines.append(f"--{boundary}")
-        lines.append("Content-Type: multipart/mixed;boundary=changeset_001")
-        lines.append("")
-
-        for idx, payload in enumerate(payloads):
-            lines.append("--changeset_001")
-            lines.append("Content-Type: application/http")
-            lines.append("Content-Transfer-Encoding: binary")
-            lines.append(f"Content-ID: {idx + 1}")
-            lines.append("")
-            lines.append(f"POST {action} HTTP/1.1")
-            lines.append("Content-Type: application/json; charset=utf-8")
-            lines.append("")
-            lines.append(json.dumps(payload))
-            lines.append("")
-
-        lines.append("--changeset_001--")
-        lines.append(f"--{boundary}--")
-        return CRLF.join(lines)
+        request_line = (
+            f"\r\n\r\nPOST {action} HTTP/1.1\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n\r\n"
+        ).encode("ascii")
+
+        buf = bytearray(f"--{boundary}\r\n".encode("ascii"))
+        buf += _BATCH_CHANGESET_START
+        for idx, payload in enumerate(payloads, start=1):
+            buf += _BATCH_PART_HEADER
+            buf += str(idx).encode("ascii")
+            buf += request_line
+            buf += _json_bytes(payload)
+            buf += b"\r\n\r\n"
+        buf += _BATCH_CHANGESET_END
+        buf += f"--{boundary}--".encode("ascii")
+        return bytes(buf)
 
     @staticmethod
     def _parse_batch_response(
-        response_text: str,
+        response_bytes: bytes,
         options: list[OptionItem],
     ) -> BatchReport:
         """
@@ -474,39 +941,33 @@ class DataverseOptionSetService:
         """
         report = BatchReport(total=len(options))
 
-        # Each sub-response is delimited by a boundary and contains an HTTP
-        # status line like "HTTP/1.1 204 No Content" or "HTTP/1.1 400 …"
-        parts = response_text.split("--changesetresponse_")
-        result_idx = 0
-        for part in parts:
-            # find the HTTP status line
-            for line in part.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("HTTP/1.1"):
-                    tokens = stripped.split(" ", 2)
-                    code = int(tokens[1]) if len(tokens) > 1 else 0
-                    detail = tokens[2] if len(tokens) > 2 else ""
-                    success = 200 <= code < 300
-                    opt = (
-                        options[result_idx]
-                        if result_idx < len(options)
-                        else OptionItem(label="?", value=-1)
-                    )
-                    br = BatchResult(
-                        index=result_idx,
-                        label=opt.label,
-                        value=opt.value,
-                        status_code=code,
-                        success=success,
-                        detail=detail,
-                    )
-                    report.results.append(br)
-                    if success:
-                        report.succeeded += 1
-                    else:
-                        report.failed += 1
-                    result_idx += 1
-                    break
+        # Each sub-response contains an HTTP status line like
+        # "HTTP/1.1 204 No Content" or "HTTP/1.1 400 …"; one regex pass over
+        # the raw body finds them in order.
+        n_options = len(options)
+        for result_idx, m in enumerate(_HTTP_STATUS_RE.finditer(response_bytes)):
+            code = int(m.group(1))
+            detail = (m.group(2) or b"").strip().decode("utf-8", "replace")
+            success = 200 <= code < 300
+            opt = (
+                options[result_idx]
+                if result_idx < n_options
+                else OptionItem(label="?", value=-1)
+            )
+            report.results.append(
+                BatchResult(
+                    index=result_idx,
+                    label=opt.label,
+                    value=opt.value,
+                    status_code=code,
+                    success=success,
+                    detail=detail,
+                )
+            )
+            if success:
+                report.succeeded += 1
+            else:
+                report.failed += 1
 
         # If we couldn't parse individual results, estimate from HTTP status
         if not report.results:
@@ -516,6 +977,149 @@ class DataverseOptionSetService:
     # ------------------------------------------------------------------
     # Batch operations (with progress callback)
     # ------------------------------------------------------------------
+    def _post_batch(self, body: bytes, headers: dict) -> requests.Response:
+        """
+        POST one ``$batch`` body, backing off on throttling responses.
+
+        Dataverse answers 429 / 503 with a ``Retry-After`` header when the
+        service-protection limits are hit; the wait is honoured with a bit
+        of jitter so concurrent chunks don't retry in lock-step.
+        """
+        attempt = 1
+        while True:
+            resp = self._request(
+                "POST",
+                f"{self._base_url}/$batch",
+                headers=headers,
+                data=body,
+                timeout=300,
+            )
+            if resp.status_code not in (429, 503) or attempt >= self.MAX_BATCH_ATTEMPTS:
+                return resp
+            retry_after = _retry_after_seconds(resp.headers.get("Retry-After"))
+            logger.debug(
+                "Batch throttled (HTTP %s), retrying in %.1f s", resp.status_code, retry_after
+            )
+            time.sleep(retry_after + random.uniform(0, 0.5))
+            attempt += 1
+
+    def _batch_headers(self, boundary: str, continue_on_error: bool) -> dict:
+        headers = self._headers(content_type=f"multipart/mixed;boundary={boundary}")
+        if continue_on_error:
+            headers["Prefer"] = "odata.continue-on-error"
+        return headers
+
+    def _split_chunks(
+        self,
+        options: list[OptionItem],
+        payloads: list[dict],
+        chunk_size: int,
+    ) -> list[tuple[int, list[OptionItem], list[dict]]]:
+        """Return ``(start, options, payloads)`` tuples of at most ``chunk_size``."""
+        chunk_size = max(1, min(chunk_size, self.MAX_BATCH_SIZE))
+        if 0 < len(options) <= chunk_size:
+            # Common case (the GUI already sends 50-item batches): no copies
+            return [(0, options, payloads)]
+        return [
+            (start, options[start:start + chunk_size], payloads[start:start + chunk_size])
+            for start in range(0, len(options), chunk_size)
+        ]
+
+    @staticmethod
+    def _merge_reports(total: int, reports: list[BatchReport]) -> BatchReport:
+        merged = BatchReport(total=total)
+        for rep in reports:
+            merged.succeeded += rep.succeeded
+            merged.failed += rep.failed
+            merged.results.extend(rep.results)
+        return merged
+
+    def _execute_one_batch(
+        self,
+        action: str,
+        options: list[OptionItem],
+        payloads: list[dict],
+        *,
+        start: int = 0,
+        continue_on_error: bool = False,
+    ) -> BatchReport:
+        """
+        Send a single ``$batch`` request for one chunk of options.
+
+        ``start`` is the position of the chunk inside the caller's list and
+        is added to every ``BatchResult.index``.
+        """
+        boundary = f"batch_{int(time.time() * 1000)}"
+        body = self._build_batch_body(action, payloads, boundary)
+        headers = self._batch_headers(boundary, continue_on_error)
+
+        resp = self._post_batch(body, headers)
+        try:
+            resp.raise_for_status()
+        except Exception:
+            _log_batch_failure(body, resp.content)
+            raise
+
+        report = self._parse_batch_response(resp.content, options)
+        if start:
+            for r in report.results:
+                r.index += start
+        return report
+
+    def _run_bulk(
+        self,
+        action: str,
+        options: list[OptionItem],
+        payloads: list[dict],
+        *,
+        continue_on_error: bool,
+        chunk_size: int,
+        max_workers: int,
+        progress_callback: Any = None,
+    ) -> BatchReport:
+        """
+        Split ``options`` into chunks of ``chunk_size`` and dispatch one
+        ``$batch`` per chunk, up to ``max_workers`` of them concurrently.
+        The per-chunk reports are merged in input order.  Chunk progress is
+        reported through ``progress_callback`` at most every 100 ms.
+        """
+        # Make sure the token outlives the whole bulk call; workers only read it
+        self._ensure_token_valid()
+
+        jobs = self._split_chunks(options, payloads, chunk_size)
+
+        if len(jobs) <= 1 or max_workers <= 1:
+            reports = [
+                self._execute_one_batch(
+                    action, opts, pls, start=start, continue_on_error=continue_on_error
+                )
+                for start, opts, pls in jobs
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                futures = [
+                    pool.submit(
+                        self._execute_one_batch,
+                        action,
+                        opts,
+                        pls,
+                        start=start,
+                        continue_on_error=continue_on_error,
+                    )
+                    for start, opts, pls in jobs
+                ]
+                throttled = _Throttled(progress_callback) if progress_callback else None
+                for done, fut in enumerate(as_completed(futures), 1):
+                    fut.result()
+                    if throttled:
+                        throttled(
+                            f"{done}/{len(jobs)} chunks done",
+                            force=done == len(jobs),
+                        )
+                reports = [f.result() for f in futures]
+
+        return self._merge_reports(len(options), reports)
+
     def bulk_insert_options(
         self,
         options: list[OptionItem],
@@ -526,54 +1130,37 @@ class DataverseOptionSetService:
         attribute_logical_name: str | None = None,
         continue_on_error: bool = False,
         progress_callback: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 3,
     ) -> BatchReport:
         """
         $batch InsertOptionValue for many options at once.
-        Always requests a **new** token before the batch call.
+        The token is only refreshed when it is close to expiry.
+        Inputs larger than ``chunk_size`` are split into several $batch
+        requests sent on up to ``max_workers`` threads.
         """
-        # Fresh token for batch
-        self.get_bearer_token(force_new=True)
-
-        payloads = []
-        for opt in options:
-            payloads.append(
-                opt.to_insert_payload(
-                    option_set_name,
-                    language_code,
-                    entity_logical_name=entity_logical_name,
-                    attribute_logical_name=attribute_logical_name,
-                )
-            )
-
-        boundary = f"batch_{int(time.time() * 1000)}"
-        body = self._build_batch_body("InsertOptionValue", payloads, boundary)
-
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": f"multipart/mixed;boundary={boundary}",
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-        }
-        if continue_on_error:
-            headers["Prefer"] = "odata.continue-on-error"
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._insert_payload(language_code, scope) for opt in options]
 
         if progress_callback:
             progress_callback(f"Sending batch INSERT for {len(options)} options …")
 
-        resp = requests.post(
-            f"{self._base_url}/$batch",
-            headers=headers,
-            data=body.encode("utf-8"),
-            timeout=300,
-        )
         try:
-            resp.raise_for_status()
-        except Exception:
-            print("Batch request body:\n", body)
-            print("Batch response:\n", resp.text)
-            raise
-
-        report = self._parse_batch_response(resp.text, options)
+            report = self._run_bulk(
+                "InsertOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
         if progress_callback:
             progress_callback(
                 f"Batch INSERT complete: {report.succeeded}/{report.total} succeeded"
@@ -591,54 +1178,37 @@ class DataverseOptionSetService:
         attribute_logical_name: str | None = None,
         continue_on_error: bool = False,
         progress_callback: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 3,
     ) -> BatchReport:
         """
         $batch UpdateOptionValue for many options at once.
-        Always requests a **new** token before the batch call.
+        The token is only refreshed when it is close to expiry.
+        Inputs larger than ``chunk_size`` are split into several $batch
+        requests sent on up to ``max_workers`` threads.
         """
-        self.get_bearer_token(force_new=True)
-
-        payloads = []
-        for opt in options:
-            payloads.append(
-                opt.to_update_payload(
-                    option_set_name,
-                    language_code,
-                    merge_labels,
-                    entity_logical_name=entity_logical_name,
-                    attribute_logical_name=attribute_logical_name,
-                )
-            )
-
-        boundary = f"batch_{int(time.time() * 1000)}"
-        body = self._build_batch_body("UpdateOptionValue", payloads, boundary)
-
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": f"multipart/mixed;boundary={boundary}",
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-        }
-        if continue_on_error:
-            headers["Prefer"] = "odata.continue-on-error"
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._update_payload(language_code, merge_labels, scope) for opt in options]
 
         if progress_callback:
             progress_callback(f"Sending batch UPDATE for {len(options)} options …")
 
-        resp = requests.post(
-            f"{self._base_url}/$batch",
-            headers=headers,
-            data=body.encode("utf-8"),
-            timeout=300,
-        )
         try:
-            resp.raise_for_status()
-        except Exception:
-            print("Batch request body:\n", body)
-            print("Batch response:\n", resp.text)
-            raise
-
-        report = self._parse_batch_response(resp.text, options)
+            report = self._run_bulk(
+                "UpdateOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
         if progress_callback:
             progress_callback(
                 f"Batch UPDATE complete: {report.succeeded}/{report.total} succeeded"
@@ -654,60 +1224,262 @@ class DataverseOptionSetService:
         attribute_logical_name: str | None = None,
         continue_on_error: bool = True,
         progress_callback: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 3,
     ) -> BatchReport:
         """
         $batch DeleteOptionValue for many options at once.
-        Always requests a **new** token before the batch call.
+        The token is only refreshed when it is close to expiry.
         ``continue_on_error`` defaults to True for deletes (some values may
         already be missing).
+        Inputs larger than ``chunk_size`` are split into several $batch
+        requests sent on up to ``max_workers`` threads.
         """
-        self.get_bearer_token(force_new=True)
-
-        payloads = []
-        for opt in options:
-            payloads.append(
-                opt.to_delete_payload(
-                    option_set_name,
-                    entity_logical_name=entity_logical_name,
-                    attribute_logical_name=attribute_logical_name,
-                )
-            )
-
-        boundary = f"batch_{int(time.time() * 1000)}"
-        body = self._build_batch_body("DeleteOptionValue", payloads, boundary)
-
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": f"multipart/mixed;boundary={boundary}",
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-        }
-        if continue_on_error:
-            headers["Prefer"] = "odata.continue-on-error"
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._delete_payload(scope) for opt in options]
 
         if progress_callback:
             progress_callback(f"Sending batch DELETE for {len(options)} options …")
 
-        resp = requests.post(
-            f"{self._base_url}/$batch",
-            headers=headers,
-            data=body.encode("utf-8"),
-            timeout=300,
-        )
         try:
-            resp.raise_for_status()
-        except Exception:
-            print("Batch request body:\n", body)
-            print("Batch response:\n", resp.text)
-            raise
-
-        report = self._parse_batch_response(resp.text, options)
+            report = self._run_bulk(
+                "DeleteOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
         if progress_callback:
             progress_callback(
                 f"Batch DELETE complete: {report.succeeded}/{report.total} succeeded"
             )
         return report
 
+    # ------------------------------------------------------------------
+    # Async batch operations (aiohttp)
+    # ------------------------------------------------------------------
+    async def _aexecute_one_batch(
+        self,
+        session: Any,
+        semaphore: asyncio.Semaphore,
+        action: str,
+        options: list[OptionItem],
+        payloads: list[dict],
+        *,
+        start: int = 0,
+        continue_on_error: bool = False,
+    ) -> BatchReport:
+        """
+        Coroutine counterpart of :meth:`_execute_one_batch`.
+
+        Like :meth:`_request`, a 401 drops the cached token and the chunk is
+        resent once with a new one.
+        """
+        boundary = f"batch_{int(time.time() * 1000)}"
+        body = self._build_batch_body(action, payloads, boundary)
+        headers = self._batch_headers(boundary, continue_on_error)
+
+        async with semaphore:
+            attempt = 1
+            refreshed = False
+            while True:
+                async with session.post(
+                    f"{self._base_url}/$batch", headers=headers, data=body
+                ) as resp:
+                    content = await resp.read()
+                    status = resp.status
+                    retry_header = resp.headers.get("Retry-After")
+                if status == 401 and not refreshed:
+                    logger.debug("HTTP 401 from $batch – refreshing token and retrying once")
+                    refreshed = True
+                    self._invalidate_token()
+                    # Token fetch is blocking – keep it off the event loop
+                    headers = await asyncio.to_thread(
+                        self._batch_headers, boundary, continue_on_error
+                    )
+                    continue
+                if status not in (429, 503) or attempt >= self.MAX_BATCH_ATTEMPTS:
+                    break
+                retry_after = _retry_after_seconds(retry_header)
+                await asyncio.sleep(retry_after + random.uniform(0, 0.5))
+                attempt += 1
+
+        if status >= 400:
+            _log_batch_failure(body, content)
+            raise RuntimeError(f"$batch {action} failed with HTTP {status}")
+
+        report = self._parse_batch_response(content, options)
+        if start:
+            for r in report.results:
+                r.index += start
+        return report
+
+    async def _arun_bulk(
+        self,
+        action: str,
+        options: list[OptionItem],
+        payloads: list[dict],
+        *,
+        continue_on_error: bool,
+        chunk_size: int,
+        max_workers: int,
+        session: Any = None,
+    ) -> BatchReport:
+        """
+        Async counterpart of :meth:`_run_bulk`: every chunk is a task and at
+        most ``max_workers`` requests are in flight at once.  When a chunk
+        fails the other tasks are cancelled (and awaited) before the error
+        propagates, so none of them outlives the session.  Uses ``session``
+        when given, otherwise opens (and closes) its own
+        ``aiohttp.ClientSession``.
+        """
+        # Token refresh is blocking – do it once, off the event loop
+        await asyncio.to_thread(self._ensure_token_valid)
+
+        jobs = self._split_chunks(options, payloads, chunk_size)
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        own_session = session is None
+        if own_session:
+            import aiohttp
+
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32),
+                timeout=aiohttp.ClientTimeout(total=300),
+            )
+        try:
+            tasks = [
+                asyncio.ensure_future(
+                    self._aexecute_one_batch(
+                        session,
+                        semaphore,
+                        action,
+                        opts,
+                        pls,
+                        start=start,
+                        continue_on_error=continue_on_error,
+                    )
+                )
+                for start, opts, pls in jobs
+            ]
+            try:
+                reports = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            if own_session:
+                await session.close()
+        return self._merge_reports(len(options), list(reports))
+
+    async def abulk_insert_options(
+        self,
+        options: list[OptionItem],
+        option_set_name: str,
+        language_code: int = 1033,
+        *,
+        entity_logical_name: str | None = None,
+        attribute_logical_name: str | None = None,
+        continue_on_error: bool = False,
+        session: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> BatchReport:
+        """Async :meth:`bulk_insert_options` (requires ``aiohttp``)."""
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._insert_payload(language_code, scope) for opt in options]
+        try:
+            return await self._arun_bulk(
+                "InsertOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                session=session,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
+
+    async def abulk_update_options(
+        self,
+        options: list[OptionItem],
+        option_set_name: str,
+        language_code: int = 1033,
+        merge_labels: bool = False,
+        *,
+        entity_logical_name: str | None = None,
+        attribute_logical_name: str | None = None,
+        continue_on_error: bool = False,
+        session: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> BatchReport:
+        """Async :meth:`bulk_update_options` (requires ``aiohttp``)."""
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._update_payload(language_code, merge_labels, scope) for opt in options]
+        try:
+            return await self._arun_bulk(
+                "UpdateOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                session=session,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
+
+    async def abulk_delete_options(
+        self,
+        options: list[OptionItem],
+        option_set_name: str,
+        *,
+        entity_logical_name: str | None = None,
+        attribute_logical_name: str | None = None,
+        continue_on_error: bool = True,
+        session: Any = None,
+        chunk_size: int = 1000,
+        max_workers: int = 8,
+    ) -> BatchReport:
+        """Async :meth:`bulk_delete_options` (requires ``aiohttp``)."""
+        scope = _scope_fields(option_set_name, entity_logical_name, attribute_logical_name)
+        payloads = [opt._delete_payload(scope) for opt in options]
+        try:
+            return await self._arun_bulk(
+                "DeleteOptionValue",
+                options,
+                payloads,
+                continue_on_error=continue_on_error,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                session=session,
+            )
+        finally:
+            self.invalidate_optionset_cache(
+                option_set_name,
+                entity_logical_name=entity_logical_name,
+                attribute_logical_name=attribute_logical_name,
+            )
+
     # ------------------------------------------------------------------
     # Duplicate-safe insert
     # ------------------------------------------------------------------
@@ -724,15 +1496,23 @@ class DataverseOptionSetService:
     ) -> tuple[BatchReport | None, list[OptionItem]]:
         """
         Insert only options whose *Value* does not already exist.
-        Returns ``(report, skipped)`` where ``skipped`` lists duplicates.
+        Returns ``(report, skipped)`` where ``skipped`` lists duplicates –
+        values already in the OptionSet or repeated within ``options``.
         """
         existing = self.get_existing_values(
             option_set_name,
             entity_logical_name=entity_logical_name,
             attribute_logical_name=attribute_logical_name,
         )
-        to_insert = [o for o in options if o.value not in existing]
-        skipped = [o for o in options if o.value in existing]
+        seen: set[int] = set()
+        to_insert: list[OptionItem] = []
+        skipped: list[OptionItem] = []
+        for o in options:
+            if o.value in existing or o.value in seen:
+                skipped.append(o)
+            else:
+                seen.add(o.value)
+                to_insert.append(o)
 
         if progress_callback and skipped:
             progress_callback(
@@ -759,7 +1539,12 @@ class DataverseOptionSetService:
 # ---------------------------------------------------------------------------
 # Factory helper
 # ---------------------------------------------------------------------------
-def create_service_from_env(env_path: str = ".env") -> DataverseOptionSetService:
+def create_service_from_env(
+    env_path: str = ".env",
+    *,
+    transport: Literal["requests", "httpx"] = "requests",
+    pool_maxsize: int = 32,
+) -> DataverseOptionSetService:
     """Instantiate the service using values from a .env file."""
     import os
 
@@ -769,5 +1554,7 @@ def create_service_from_env(env_path: str = ".env") -> DataverseOptionSetService
         tenant_id=os.environ["tenant_id"],
         client_id=os.environ["client_id"],
         client_secret=os.environ["client_secret"],
+        transport=transport,
+        pool_maxsize=pool_maxsize,
     )
 
@@ -14,128 +14,446 @@ Usage
     python cli.py bulk-insert  --from-csv data.csv --optionset cap_phoneprefix
     python cli.py bulk-update  --from-csv data.csv --optionset cap_phoneprefix
     python cli.py bulk-delete  --from-csv data.csv --optionset cap_phoneprefix
+    python cli.py cache clear              # drop cached OptionSet metadata
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
+import itertools
 import json
+import logging
+import operator
 import os
+import queue
 import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
-
-import requests
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, IntPrompt, Prompt
-from rich.table import Table
-from rich.text import Text
-from rich import box
-
-from OptionSetHelper import (
-    BatchReport,
-    DataverseOptionSetService,
-    OptionItem,
-    create_service_from_env,
-)
-
-console = Console()
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+# rich and OptionSetHelper (which pulls in requests) are imported inside the
+# functions that need them, so `cli.py --help` and argument errors stay fast.
+if TYPE_CHECKING:
+    from OptionSetHelper import (
+        BatchReport,
+        BatchResult,
+        DataverseOptionSetService,
+        OptionItem,
+    )
+
+
+class _LazyConsole:
+    """
+    Stand-in for ``rich.console.Console`` that is created on first use.
+    Set ``stderr`` before the first print to send all console output to
+    stderr (``--report-format jsonl`` keeps stdout for the records).
+    """
+
+    _console = None
+    stderr = False
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console(stderr=_LazyConsole.stderr)
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+bulk_logger = logging.getLogger("bulk")
+
+BATCH_SIZE = 50           # options per $batch request sent by the bulk commands
+DEFAULT_MAX_WORKERS = 10  # $batch requests in flight at once
+FAILED_TAIL = 500         # failed rows kept in memory for the results table
+
+# Metadata responses are cached on disk between CLI runs (see _cached)
+CACHE_DIR = Path(os.environ.get("DV_OPTIONSET_CACHE", Path.home() / ".dv_optionset_cache"))
+CACHE_TTL = 1800  # seconds
+# Parsed option files are cached as parquet, keyed on the source path (see
+# _iter_options_via_parquet)
+PARSE_CACHE_DIR = CACHE_DIR / "parsed"
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _load_options_from_csv(path: str) -> list[OptionItem]:
+_CSV_ARROW_THRESHOLD = 1_000_000  # bytes; larger CSVs go through pyarrow when available
+_CSV_DELIMITERS = ",;\t|"
+_SINGLE_COLUMN_HEADERS = frozenset({"label", "labels", "name", "option", "options"})
+
+
+def _is_int(cell: str) -> bool:
+    return cell.strip().lstrip("-").isdigit()
+
+
+def _iter_rows_to_options(rows) -> Iterator[OptionItem]:
+    """Turn parsed CSV rows (lists of strings) into OptionItems."""
+    from OptionSetHelper import OptionItem
+
+    count = 0
+    for row in rows:
+        if not row:
+            continue
+        row = [c.strip() for c in row]
+        if len(row) >= 3:
+            # col0=sap, col1=value (label text), col2=numeric value
+            try:
+                val = int(row[0])
+                label = row[1]
+            except ValueError:
+                try:
+                    val = int(row[2])
+                    label = row[1]
+                except ValueError:
+                    continue
+            yield OptionItem(label=label, value=val)
+            count += 1
+        elif len(row) == 2:
+            label = row[0]
+            try:
+                val = int(row[1])
+            except ValueError:
+                continue
+            yield OptionItem(label=label, value=val)
+            count += 1
+        elif len(row) == 1:
+            # single-column: auto-assign value
+            yield OptionItem(label=row[0], value=count)
+            count += 1
+
+
+def _iter_options_arrow(
+    path: str, n_cols: int, has_header: bool, delimiter: str = ","
+) -> Iterator[OptionItem] | None:
     """
-    Load options from a CSV file.
+    Parse a large CSV with pyarrow's multithreaded reader, or return
+    ``None`` if pyarrow is unavailable or can't handle the file (e.g.
+    ragged rows).
+
+    Plain ``label,value`` files are converted column-wise (the integer
+    parsing and whitespace trimming happen in Arrow); anything else is read
+    as strings and goes through the usual row rules.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return None
+
+    from OptionSetHelper import OptionItem
+
+    names = [f"c{i}" for i in range(n_cols)]
+    read_options = pa_csv.ReadOptions(
+        column_names=names,
+        skip_rows=1 if has_header else 0,
+        block_size=1 << 20,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+
+    if n_cols == 2:
+        try:
+            table = pa_csv.read_csv(
+                path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={"c0": pa.string(), "c1": pa.int64()},
+                    strings_can_be_null=False,
+                ),
+            )
+        except (pa.ArrowInvalid, OSError):
+            pass  # e.g. a non-integer value somewhere – use the row rules below
+        else:
+            labels = pc.utf8_trim_whitespace(table["c0"]).to_pylist()
+            values = table["c1"].to_pylist()
+            return (
+                OptionItem(label=label, value=value)
+                for label, value in zip(labels, values)
+                if value is not None
+            )
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={n: pa.string() for n in names},
+                strings_can_be_null=False,
+            ),
+        )
+    except (pa.ArrowInvalid, OSError):
+        return None
+    columns = table.to_pydict()
+    return _iter_rows_to_options(zip(*(columns[n] for n in names)))
+
+
+def _iter_options_from_csv(path: str) -> Iterator[OptionItem]:
+    """
+    Yield options from a CSV file as rows are read.
 
     Supported CSV formats
     ---------------------
+    * **1 column**  – ``label``  (values are assigned 0, 1, 2, …)
     * **2 columns** – ``label, value``  (value must be an integer)
     * **3 columns** – ``col1, col2, value``  → label = "col2 - col1" (same
       concat logic as the notebook)
 
-    The file may have a header row – the loader auto-detects it.
+    The delimiter is sniffed from the first 1 KB (``, ; tab |``), falling
+    back to commas.  The file may have a header row – it is detected from
+    the first line: a multi-column row without any integer cell, or a lone
+    ``label`` / ``name`` cell in a single-column file.  As in the Qt
+    loader, a quoted ``"Smith, John"`` is one label.
+    Files over 1 MB are parsed with pyarrow when it is installed.
     """
-    items: list[OptionItem] = []
     with open(path, newline="", encoding="utf-8-sig") as fh:
-        sample = fh.read(2048)
+        sample = fh.read(1024)
         fh.seek(0)
-        sniffer = csv.Sniffer()
         try:
-            dialect = sniffer.sniff(sample)
+            dialect = csv.Sniffer().sniff(sample, delimiters=_CSV_DELIMITERS)
         except csv.Error:
-            dialect = csv.excel  # type: ignore[assignment]
-        has_header = sniffer.has_header(sample)
+            dialect = csv.excel
         reader = csv.reader(fh, dialect)
-        if has_header:
-            next(reader)  # skip header
-        for row in reader:
-            if not row:
-                continue
-            row = [c.strip() for c in row]
-            if len(row) >= 3:
-                # col0=sap, col1=value (label text), col2=numeric value
-                try:
-                    val = int(row[0])
-                    label = row[1]
-                except ValueError:
-                    try:
-                        val = int(row[2])
-                        label = row[1]
-                    except ValueError:
-                        continue
-                items.append(OptionItem(label=label, value=val))
-            elif len(row) == 2:
-                label = row[0]
-                try:
-                    val = int(row[1])
-                except ValueError:
-                    continue
-                items.append(OptionItem(label=label, value=val))
-            elif len(row) == 1:
-                # single-column: auto-assign value
-                items.append(OptionItem(label=row[0], value=len(items)))
-    return items
+        first = next(reader, None)
+        if first is None:
+            return
+        if len(first) > 1:
+            has_header = not any(_is_int(c) for c in first)
+        else:
+            has_header = first[0].strip().lower() in _SINGLE_COLUMN_HEADERS
 
+        if len(first) > 1 and os.path.getsize(path) > _CSV_ARROW_THRESHOLD:
+            items = _iter_options_arrow(path, len(first), has_header, dialect.delimiter)
+            if items is not None:
+                yield from items
+                return
 
-def _load_options_from_json(path: str) -> list[OptionItem]:
+        if not has_header:
+            reader = itertools.chain([first], reader)
+        yield from _iter_rows_to_options(reader)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, preferring orjson over the stdlib decoder."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _iter_options_from_json(path: str) -> Iterator[OptionItem]:
     """
-    Load options from a JSON file.
+    Yield OptionItems from a JSON file.
 
     Expected shape: ``[{"label": "...", "value": 1}, ...]``
     or a dict like ``{"Label Text": intValue, ...}``
+
+    With ``ijson`` installed the file is parsed incrementally, so items are
+    produced without holding the whole document in memory; otherwise the
+    whole file is decoded at once (with ``orjson`` when available).
+    """
+    from OptionSetHelper import OptionItem
+
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if ijson is None:
+        with open(path, "rb") as fh:
+            data = _json_loads(fh.read().removeprefix(b"\xef\xbb\xbf"))
+        if isinstance(data, list):
+            for entry in data:
+                yield OptionItem(label=entry["label"], value=int(entry["value"]))
+        elif isinstance(data, dict):
+            for label, value in data.items():
+                yield OptionItem(label=label, value=int(value))
+        return
+
+    with open(path, "rb") as fh:
+        if fh.read(3) != b"\xef\xbb\xbf":
+            fh.seek(0)
+        start = fh.tell()
+        # Peek at the first significant byte to tell a list from a dict
+        head = fh.read(256).lstrip()
+        fh.seek(start)
+        if head.startswith(b"["):
+            for entry in ijson.items(fh, "item"):
+                yield OptionItem(label=entry["label"], value=int(entry["value"]))
+        elif head.startswith(b"{"):
+            for label, value in ijson.kvitems(fh, ""):
+                yield OptionItem(label=label, value=int(value))
+
+
+_PARQUET_CHUNK = 65_536  # rows per record batch written to the parquet cache
+_PARSE_CACHE_VERSION = 2  # bump when the CSV row rules change
+
+
+def _iter_options_via_parquet(path: str) -> Iterator[OptionItem]:
+    """
+    Yield a CSV's options from its parquet cache under ``PARSE_CACHE_DIR``
+    when that cache was written for the file's current mtime and size (and
+    the current parser); otherwise parse the CSV and write the cache as a
+    side effect.  The cache only replaces the old one once the whole file
+    has been read.  Without pyarrow this is simply
+    :func:`_iter_options_from_csv`.
     """
-    with open(path, encoding="utf-8-sig") as fh:
-        data = json.load(fh)
-    items: list[OptionItem] = []
-    if isinstance(data, list):
-        for entry in data:
-            items.append(OptionItem(label=entry["label"], value=int(entry["value"])))
-    elif isinstance(data, dict):
-        for label, value in data.items():
-            items.append(OptionItem(label=label, value=int(value)))
-    return items
-
-
-def load_options(path: str) -> list[OptionItem]:
-    """Auto-detect CSV or JSON and load OptionItems."""
-    ext = Path(path).suffix.lower()
-    if ext == ".json":
-        return _load_options_from_json(path)
-    return _load_options_from_csv(path)
-
-
-def _print_batch_report(report: BatchReport) -> None:
-    """Pretty-print a BatchReport with a Rich table."""
-    table = Table(
-        title="Batch Results",
-        box=box.ROUNDED,
-        show_lines=True,
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        yield from _iter_options_from_csv(path)
+        return
+
+    from OptionSetHelper import OptionItem
+
+    st = os.stat(path)
+    key = f"{_PARSE_CACHE_VERSION}_{st.st_mtime_ns}_{st.st_size}".encode()
+    source = os.path.abspath(path)
+    cache_path = str(
+        PARSE_CACHE_DIR / f"{hashlib.sha256(source.encode()).hexdigest()}.parquet"
     )
+
+    try:
+        cached = pq.ParquetFile(cache_path)
+        if (cached.schema_arrow.metadata or {}).get(b"key") == key:
+            for rb in cached.iter_batches(batch_size=_PARQUET_CHUNK):
+                for label, value in zip(rb.column(0).to_pylist(), rb.column(1).to_pylist()):
+                    yield OptionItem(label=label, value=value)
+            return
+    except (OSError, pa.ArrowInvalid):
+        pass  # no cache yet, or an unreadable one – rebuild it
+
+    schema = pa.schema([("label", pa.string()), ("value", pa.int64())], metadata={"key": key})
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        writer = pq.ParquetWriter(tmp_path, schema)
+    except OSError:
+        writer = None  # e.g. read-only directory – just parse
+    labels: list[str] = []
+    values: list[int] = []
+
+    def _flush() -> None:
+        writer.write_table(pa.table({"label": labels, "value": values}, schema=schema))
+        labels.clear()
+        values.clear()
+
+    complete = False
+    try:
+        for item in _iter_options_from_csv(path):
+            yield item
+            if writer is not None:
+                labels.append(item.label)
+                values.append(item.value)
+                if len(labels) >= _PARQUET_CHUNK:
+                    _flush()
+        complete = True
+    finally:
+        if writer is not None:
+            if complete and labels:
+                _flush()
+            writer.close()
+            if complete:
+                os.replace(tmp_path, cache_path)
+            else:
+                os.remove(tmp_path)
+
+
+def iter_options(path: str, *, use_cache: bool = True) -> Iterator[OptionItem]:
+    """
+    Auto-detect CSV or JSON and yield OptionItems while the file is parsed.
+    Combine with :func:`_batched` to work through large files in bounded
+    memory.  Parsed CSVs are cached as parquet under ``PARSE_CACHE_DIR``
+    (when pyarrow is installed) unless ``use_cache`` is false.
+    """
+    if Path(path).suffix.lower() == ".json":
+        return _iter_options_from_json(path)
+    if use_cache:
+        return _iter_options_via_parquet(path)
+    return _iter_options_from_csv(path)
+
+
+def load_options(path: str, *, use_cache: bool = True) -> list[OptionItem]:
+    """Auto-detect CSV or JSON and load all OptionItems into a list."""
+    return list(iter_options(path, use_cache=use_cache))
+
+
+def _batched(it: Iterable[OptionItem], n: int) -> Iterator[list[OptionItem]]:
+    """Yield successive lists of up to ``n`` items from ``it``."""
+    it = iter(it)
+    while chunk := list(itertools.islice(it, n)):
+        yield chunk
+
+
+_STATUS_STYLES = ("bold red", "green")  # indexed by BatchResult.success
+_STATUS_ICONS = ("❌", "✅")
+PAGER_ROWS = 100            # longer result tables are shown through the pager
+LARGE_REPORT_ROWS = 5000    # beyond this only the first failures are tabulated
+COMPACT_REPORT_ROWS = 200
+
+
+def _jsonl_record(r: BatchResult) -> str:
+    """One ``--report-format jsonl`` line for a batch result."""
+    return json.dumps(
+        {
+            "idx": r.index,
+            "label": r.label,
+            "value": r.value,
+            "status": r.status_code,
+            "success": r.success,
+            "detail": r.detail,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _print_batch_report(
+    report: BatchReport,
+    fmt: str = "table",
+    status_codes: Counter | None = None,
+) -> None:
+    """
+    Print a BatchReport in one of the ``--report-format`` styles:
+
+    * ``jsonl``   – the final totals line on stdout.  The per-result
+      records before it are streamed by :func:`_run_batches` (``jsonl=True``)
+      as each batch completes; main() sends all other console output to
+      stderr in this mode.
+    * ``table``   – a Rich table of its ``results`` (the bulk commands only
+      keep failed rows there) followed by a summary panel.  Very large
+      reports are cut down to their first failures, and long tables go
+      through the pager on a terminal.
+    * ``summary`` – the summary panel only.
+
+    ``table`` and ``summary`` also draw a histogram of ``status_codes`` when
+    given.
+    """
+    if fmt == "jsonl":
+        totals = {"total": report.total, "succeeded": report.succeeded, "failed": report.failed}
+        print(json.dumps(totals))
+        return
+
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    results = report.results if fmt == "table" else []
+    title = "Failed Results" if report.failed else "Batch Results"
+    if len(results) > LARGE_REPORT_ROWS:
+        results = [r for r in results if not r.success][:COMPACT_REPORT_ROWS]
+        title = f"First {len(results)} Failed Results"
+
+    table = Table(title=title, box=box.ROUNDED, show_lines=True)
     table.add_column("#", style="dim", width=5)
     table.add_column("Label", min_width=20)
     table.add_column("Value", justify="right", width=8)
@@ -143,19 +461,33 @@ def _print_batch_report(report: BatchReport) -> None:
     table.add_column("Result", min_width=12)
     table.add_column("Detail", style="dim")
 
-    for r in report.results:
-        status_style = "green" if r.success else "bold red"
-        status_icon = "✅" if r.success else "❌"
+    # Only a handful of distinct (status, success) pairs occur, so share one
+    # Text per pair instead of building one per row.
+    status_cells: dict[tuple[int, bool], Text] = {}
+    for r in results:
+        key = (r.status_code, r.success)
+        status_cell = status_cells.get(key)
+        if status_cell is None:
+            status_cell = status_cells[key] = Text(
+                str(r.status_code), style=_STATUS_STYLES[r.success]
+            )
         table.add_row(
             str(r.index + 1),
             r.label,
             str(r.value),
-            Text(str(r.status_code), style=status_style),
-            status_icon,
+            status_cell,
+            _STATUS_ICONS[r.success],
             r.detail,
         )
 
-    console.print(table)
+    if results:
+        if console.is_terminal and len(results) > PAGER_ROWS:
+            with console.pager(styles=True):
+                console.print(table)
+        else:
+            console.print(table)
+    if status_codes:
+        _print_status_histogram(status_codes)
     summary_style = "green" if report.failed == 0 else "yellow"
     console.print(
         Panel(
@@ -168,31 +500,271 @@ def _print_batch_report(report: BatchReport) -> None:
     )
 
 
+def _print_status_histogram(status_codes: Counter) -> None:
+    """Draw one bar per HTTP status code, scaled to the most frequent one."""
+    from rich.bar import Bar
+    from rich.table import Table
+    from rich.text import Text
+
+    peak = max(status_codes.values())
+    table = Table(title="Status Codes", show_header=False, box=None)
+    table.add_column("Status", justify="right")
+    table.add_column("Bar", width=40)
+    table.add_column("Count", justify="right")
+    for code, n in sorted(status_codes.items()):
+        table.add_row(
+            Text(str(code), style=_STATUS_STYLES[code < 400]),
+            Bar(size=peak, begin=0, end=n, color="green" if code < 400 else "red"),
+            str(n),
+        )
+    console.print(table)
+
+
+def _pick_label(labeled: dict | None, lang: int) -> str:
+    """Return the ``LocalizedLabels`` entry for ``lang`` of a Label/DisplayName dict."""
+    return next(
+        (
+            loc["Label"]
+            for loc in (labeled or {}).get("LocalizedLabels", ())
+            if loc.get("LanguageCode") == lang
+        ),
+        "",
+    )
+
+
 def _print_optionset_table(options: list[dict], language_code: int = 1033) -> None:
     """Print existing OptionSet options in a Rich table."""
+    from rich import box
+    from rich.table import Table
+
     table = Table(title="OptionSet Options", box=box.ROUNDED, show_lines=True)
     table.add_column("Value", justify="right", width=8)
     table.add_column("Label", min_width=30)
 
+    # Sorted copy: the service caches and shares the list it returned
     for opt in sorted(options, key=lambda o: o.get("Value", 0)):
-        lbl = ""
-        for loc in opt.get("Label", {}).get("LocalizedLabels", []):
-            if loc.get("LanguageCode") == language_code:
-                lbl = loc["Label"]
-                break
+        lbl = _pick_label(opt.get("Label"), language_code)
         table.add_row(str(opt.get("Value", "?")), lbl)
 
     console.print(table)
 
 
+def _cached(
+    svc: DataverseOptionSetService,
+    args: argparse.Namespace,
+    key: str,
+    fetch: Callable[[], Any],
+) -> Any:
+    """
+    Return ``fetch()``'s JSON result from the disk cache if it is younger
+    than ``CACHE_TTL``; otherwise call it and store the result.
+    Entries are scoped to the environment URL.  ``--no-cache`` bypasses
+    the cache; mutating commands clear it (see :func:`_clear_cache`).
+    """
+    if getattr(args, "no_cache", False):
+        return fetch()
+
+    digest = hashlib.sha256(f"{svc.environment_url}|{key}".encode()).hexdigest()
+    path = CACHE_DIR / f"{digest}.json"
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)
+    except (OSError, ValueError):
+        pass  # missing or unreadable entry – refetch
+
+    data = fetch()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # caching is best-effort
+    return data
+
+
+def _clear_cache(*, parsed: bool = False) -> int:
+    """
+    Delete every cached metadata entry (and, with ``parsed``, every cached
+    parsed option file); return how many were removed.
+    """
+    removed = 0
+    paths = itertools.chain(
+        CACHE_DIR.glob("*.json"), PARSE_CACHE_DIR.glob("*.parquet") if parsed else ()
+    )
+    for path in paths:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _run_batches(
+    options: Iterable[OptionItem],
+    run_batch: Callable[[list[OptionItem]], BatchReport],
+    *,
+    desc: str,
+    max_workers: int,
+    report_out: str | None = None,
+    keep_all: bool = False,
+    jsonl: bool = False,
+) -> tuple[BatchReport, Counter]:
+    """
+    Split ``options`` into batches of ``BATCH_SIZE`` and submit them through
+    ``run_batch`` on up to ``max_workers`` threads.
+
+    ``options`` may be a lazy iterator (see :func:`iter_options`): a
+    producer thread parses it into batches on a bounded queue while the
+    workers are already sending earlier batches, so file parsing overlaps
+    with the HTTP round-trips.
+
+    ``run_batch`` sends one batch and returns its report.  Only running
+    totals, a per-status-code histogram (returned alongside the report) and
+    the last ``FAILED_TAIL`` failures are kept in memory – or every result
+    with ``keep_all``.  With ``report_out`` every result row is also
+    appended to that CSV file as its batch completes, and with ``jsonl``
+    printed to stdout as one JSON object.  A batch that raises
+    stops the remaining (not yet started) batches, and its exception is
+    re-raised once every worker has finished.
+    """
+    from OptionSetHelper import BatchReport
+
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        console.print("[yellow]tqdm not installed. Please install tqdm for progress bars.[/yellow]")
+        tqdm = None
+
+    max_workers = max(1, max_workers)
+    n_batches = -(-len(options) // BATCH_SIZE) if isinstance(options, list) else None
+    pbar = tqdm(total=n_batches, desc=desc, unit="batch") if tqdm else None
+    lock = threading.Lock()
+    stop = threading.Event()
+    batches: queue.Queue = queue.Queue(maxsize=max_workers * 2)
+
+    kept: deque = deque(maxlen=None if keep_all else FAILED_TAIL)
+    errors: list[BaseException] = []
+    counts: Counter = Counter()
+    status_codes: Counter = Counter()
+
+    report_fh = open(report_out, "w", newline="", encoding="utf-8") if report_out else None
+    writer = csv.writer(report_fh) if report_fh else None
+    if writer:
+        writer.writerow(["idx", "label", "value", "status", "detail"])
+
+    def _producer() -> None:
+        try:
+            for idx, batch in enumerate(_batched(options, BATCH_SIZE)):
+                if stop.is_set():
+                    break
+                with lock:
+                    counts["total"] += len(batch)
+                batches.put((idx, batch))
+        except Exception as exc:
+            errors.append(exc)
+            stop.set()
+        finally:
+            for _ in range(max_workers):
+                batches.put(None)
+
+    def _consumer() -> None:
+        try:
+            while (item := batches.get()) is not None:
+                if stop.is_set():
+                    continue  # keep draining so the producer never blocks
+                idx, batch = item
+                started = time.perf_counter()
+                bulk_logger.debug("Batch %d started (%d options)", idx + 1, len(batch))
+                try:
+                    report = run_batch(batch)
+                except Exception as exc:
+                    stop.set()
+                    with lock:
+                        errors.append(exc)
+                    console.print(f"[bold red]Batch {idx + 1} failed: {exc}[/bold red]")
+                    continue
+                duration = time.perf_counter() - started
+                bulk_logger.debug("Batch %d finished in %.2f s", idx + 1, duration)
+                offset = idx * BATCH_SIZE
+                with lock:
+                    counts.update(succeeded=report.succeeded, failed=report.failed)
+                    status_codes.update(r.status_code for r in report.results)
+                    for r in report.results:
+                        r.index += offset  # batch-relative -> position in the input
+                        if keep_all or not r.success:
+                            kept.append(r)
+                    if writer:
+                        writer.writerows(
+                            (r.index, r.label, r.value, r.status_code, r.detail)
+                            for r in report.results
+                        )
+                        report_fh.flush()
+                    if jsonl:
+                        for r in report.results:
+                            print(_jsonl_record(r))
+                        sys.stdout.flush()
+                    if pbar is not None:
+                        pbar.set_postfix(
+                            dur=f"{duration:.2f}s",
+                            ok=counts["succeeded"],
+                            fail=counts["failed"],
+                            refresh=False,
+                        )
+                        pbar.update(1)
+        except BaseException:
+            # Anything outside run_batch: stop the run and keep draining up
+            # to this worker's sentinel so the producer never blocks on put()
+            stop.set()
+            while batches.get() is not None:
+                pass
+            raise
+
+    if bulk_logger.isEnabledFor(logging.DEBUG):
+        import datetime
+
+        bulk_logger.debug(
+            "%s started at %s", desc, datetime.datetime.now().isoformat(timespec="seconds")
+        )
+    producer = threading.Thread(target=_producer, name="option-reader", daemon=True)
+    producer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            workers = [ex.submit(_consumer) for _ in range(max_workers)]
+        producer.join()
+    finally:
+        if report_fh:
+            report_fh.close()
+        if pbar is not None:
+            pbar.close()
+    if errors:
+        raise errors[0]
+    for fut in workers:
+        fut.result()  # re-raise a consumer that died outside run_batch
+
+    report = BatchReport(
+        results=sorted(kept, key=operator.attrgetter("index")),
+        total=len(options) if isinstance(options, list) else counts["total"],
+        succeeded=counts["succeeded"],
+        failed=counts["failed"],
+    )
+    return report, status_codes
+
+
 # ---------------------------------------------------------------------------
 # CLI commands
 # ---------------------------------------------------------------------------
 
 def cmd_list_global(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """List all global OptionSets."""
+    from rich import box
+    from rich.table import Table
+
     with console.status("[bold cyan]Fetching global OptionSets …"):
-        sets = svc.list_global_optionsets()
+        sets = _cached(svc, args, "list_global", svc.list_global_optionsets)
 
     table = Table(title="Global OptionSets", box=box.ROUNDED, show_lines=True)
     table.add_column("Name", min_width=30)
@@ -202,11 +774,7 @@ def cmd_list_global(svc: DataverseOptionSetService, args: argparse.Namespace) ->
 
     lang = getattr(args, "language_code", 1033)
     for s in sorted(sets, key=lambda x: x.get("Name", "")):
-        display = ""
-        for lbl in s.get("DisplayName", {}).get("LocalizedLabels", []):
-            if lbl.get("LanguageCode") == lang:
-                display = lbl["Label"]
-                break
+        display = _pick_label(s.get("DisplayName"), lang)
         n_opts = len(s.get("Options", []))
         table.add_row(
             s.get("Name", ""),
@@ -221,11 +789,20 @@ def cmd_list_global(svc: DataverseOptionSetService, args: argparse.Namespace) ->
 
 def cmd_search(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Search global OptionSets by display label."""
+    from rich import box
+    from rich.prompt import Prompt
+    from rich.table import Table
+
     search_text = args.label or Prompt.ask("Search text (display label)")
     lang = getattr(args, "language_code", 1033)
 
     with console.status(f"[bold cyan]Searching for '{search_text}' …"):
-        results = svc.search_global_optionsets_by_label(search_text, lang)
+        results = _cached(
+            svc,
+            args,
+            f"search|{search_text}|{lang}",
+            lambda: svc.search_global_optionsets_by_label(search_text, lang),
+        )
 
     if not results:
         console.print(f"[yellow]No OptionSets matching '{search_text}'[/yellow]")
@@ -237,10 +814,7 @@ def cmd_search(svc: DataverseOptionSetService, args: argparse.Namespace) -> None
     table.add_column("# Options", justify="right")
 
     for s in results:
-        display = ""
-        for lbl in s.get("DisplayName", {}).get("LocalizedLabels", []):
-            if lbl.get("LanguageCode") == lang:
-                display = lbl["Label"]
+        display = _pick_label(s.get("DisplayName"), lang)
         table.add_row(s["Name"], display, str(len(s.get("Options", []))))
 
     console.print(table)
@@ -248,16 +822,23 @@ def cmd_search(svc: DataverseOptionSetService, args: argparse.Namespace) -> None
 
 def cmd_show(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Show options of a specific OptionSet."""
+    from rich.prompt import Prompt
+
     name = args.optionset or Prompt.ask("OptionSet schema name")
     entity = getattr(args, "entity", None)
     attribute = getattr(args, "attribute", None)
     lang = getattr(args, "language_code", 1033)
 
     with console.status(f"[bold cyan]Fetching options for '{name}' …"):
-        options = svc.get_optionset_options(
-            name,
-            entity_logical_name=entity,
-            attribute_logical_name=attribute,
+        options = _cached(
+            svc,
+            args,
+            f"options|{name}|{entity}|{attribute}",
+            lambda: svc.get_optionset_options(
+                name,
+                entity_logical_name=entity,
+                attribute_logical_name=attribute,
+            ),
         )
 
     if not options:
@@ -270,13 +851,19 @@ def cmd_show(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
 
 def cmd_create_global(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Create a new global OptionSet."""
+    from rich.prompt import Confirm, IntPrompt, Prompt
+
+    from OptionSetHelper import OptionItem
+
     name = args.optionset or Prompt.ask("OptionSet schema name (e.g. new_phoneprefix)")
     display_label = args.display_label or Prompt.ask("Display label")
     lang = getattr(args, "language_code", 1033)
 
     # Check if it already exists
     with console.status(f"[bold cyan]Checking if '{name}' exists …"):
-        existing = svc.get_global_optionset(name)
+        existing = _cached(
+            svc, args, f"global|{name}", lambda: svc.get_global_optionset(name)
+        )
     if existing:
         console.print(f"[bold red]OptionSet '{name}' already exists![/bold red]")
         if not Confirm.ask("Continue anyway? (this will fail at the API level)"):
@@ -284,7 +871,9 @@ def cmd_create_global(svc: DataverseOptionSetService, args: argparse.Namespace)
 
     options: list[OptionItem] = []
     if args.from_file:
-        options = load_options(args.from_file)
+        options = load_options(
+            args.from_file, use_cache=not getattr(args, "no_parse_cache", False)
+        )
         console.print(f"Loaded [bold]{len(options)}[/bold] options from {args.from_file}")
     else:
         console.print("[dim]Enter options one by one. Type 'done' to finish.[/dim]")
@@ -310,6 +899,8 @@ def cmd_create_global(svc: DataverseOptionSetService, args: argparse.Namespace)
 
 def cmd_bulk_insert(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Bulk insert options into an existing OptionSet."""
+    from rich.prompt import Prompt
+
     name = args.optionset or Prompt.ask("OptionSet schema name")
     entity = getattr(args, "entity", None)
     attribute = getattr(args, "attribute", None)
@@ -320,94 +911,67 @@ def cmd_bulk_insert(svc: DataverseOptionSetService, args: argparse.Namespace) ->
         console.print("[red]--from-csv / --from-json is required for bulk insert[/red]")
         return
 
-    options = load_options(args.from_file)
-    console.print(f"Loaded [bold]{len(options)}[/bold] options from {args.from_file}")
-
-    BATCH_SIZE = 50
-    total = len(options)
-    all_results = []
-    failed = 0
-    succeeded = 0
-    from OptionSetHelper import BatchReport
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        console.print("[yellow]tqdm not installed. Please install tqdm for progress bars.[/yellow]")
-        tqdm = None
+    # Parsed lazily: the first batches are sent while the file is still being read
+    options: Iterable[OptionItem] = iter_options(
+        args.from_file, use_cache=not getattr(args, "no_parse_cache", False)
+    )
+    console.print(f"Streaming options from {args.from_file}")
 
-    batch_indices = list(range(0, total, BATCH_SIZE))
-    use_tqdm = tqdm is not None
-    if use_tqdm:
-        pbar = tqdm(total=len(batch_indices), desc="Bulk inserting", unit="batch")
-
-    def _cb(msg: str) -> None:
-        pass
-
-    import datetime
-    for idx, i in enumerate(batch_indices):
-        batch = options[i:i+BATCH_SIZE]
-        start_dt = datetime.datetime.now()
-        ts = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-        console.print(f"[dim]Batch starting at {ts}[/dim]")
-        # Refresh token at each batch
-        try:
-            svc.get_bearer_token()
-        except Exception as exc:
-            console.print(f"[bold red]Token refresh failed: {exc}[/bold red]")
-            break
-        if safe:
-            report, skipped = svc.safe_bulk_insert(
-                batch,
+    skipped = 0
+    if safe:
+        # One metadata GET for the whole run instead of one per batch
+        with console.status(f"[bold cyan]Fetching existing values of '{name}' …"):
+            existing = svc.get_existing_values(
                 name,
-                lang,
                 entity_logical_name=entity,
                 attribute_logical_name=attribute,
-                continue_on_error=args.continue_on_error,
-                progress_callback=_cb,
             )
-            if skipped:
-                console.print(f"[yellow]⚠  Skipped {len(skipped)} duplicate option(s)[/yellow]")
-            # Only extend results if report is not None
-            if report is not None:
-                all_results.extend(report.results)
-                failed += report.failed
-                succeeded += report.succeeded
-        else:
-            report = svc.bulk_insert_options(
-                batch,
-                name,
-                lang,
-                entity_logical_name=entity,
-                attribute_logical_name=attribute,
-                continue_on_error=args.continue_on_error,
-                progress_callback=_cb,
-            )
-            all_results.extend(report.results)
-            failed += report.failed
-            succeeded += report.succeeded
-        end_dt = datetime.datetime.now()
-        duration = (end_dt - start_dt).total_seconds()
-        console.print(f"[dim]Batch finished at {end_dt.strftime('%Y-%m-%d %H:%M:%S')} (duration: {duration:.2f} seconds)[/dim]")
-        if use_tqdm:
-            pbar.update(1)
-    if use_tqdm:
-        pbar.close()
-
-    # Compose a single BatchReport for all batches
-    final_report = BatchReport(
-        results=all_results,
-        total=total,
-        succeeded=succeeded,
-        failed=failed,
-    )
-    if all_results:
-        _print_batch_report(final_report)
+
+        def _dedupe(items: Iterable[OptionItem]) -> Iterator[OptionItem]:
+            nonlocal skipped
+            seen: set[int] = set()
+            for o in items:
+                if o.value in existing or o.value in seen:
+                    skipped += 1
+                    continue
+                seen.add(o.value)
+                yield o
+
+        options = _dedupe(options)
+
+    def _run_batch(batch: list[OptionItem]) -> BatchReport:
+        return svc.bulk_insert_options(
+            batch,
+            name,
+            lang,
+            entity_logical_name=entity,
+            attribute_logical_name=attribute,
+            continue_on_error=args.continue_on_error,
+        )
+
+    final_report, status_codes = _run_batches(
+        options,
+        _run_batch,
+        desc="Bulk inserting",
+        max_workers=getattr(args, "max_workers", None) or DEFAULT_MAX_WORKERS,
+        report_out=getattr(args, "report_out", None),
+        keep_all=getattr(args, "verbose_report", False),
+        jsonl=getattr(args, "report_format", "table") == "jsonl",
+    )
+    if skipped:
+        console.print(f"[yellow]⚠  Skipped {skipped} duplicate option(s)[/yellow]")
+    if final_report.total:
+        _print_batch_report(
+            final_report, getattr(args, "report_format", "table"), status_codes
+        )
     else:
         console.print("[green]Nothing to insert.[/green]")
 
 
 def cmd_bulk_update(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Bulk update options in an OptionSet."""
+    from rich.prompt import Prompt
+
     name = args.optionset or Prompt.ask("OptionSet schema name")
     entity = getattr(args, "entity", None)
     attribute = getattr(args, "attribute", None)
@@ -417,42 +981,14 @@ def cmd_bulk_update(svc: DataverseOptionSetService, args: argparse.Namespace) ->
         console.print("[red]--from-csv / --from-json is required for bulk update[/red]")
         return
 
-    options = load_options(args.from_file)
-    console.print(f"Loaded [bold]{len(options)}[/bold] options from {args.from_file}")
-
-    BATCH_SIZE = 50
-    total = len(options)
-    all_results = []
-    failed = 0
-    succeeded = 0
-    from OptionSetHelper import BatchReport
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        console.print("[yellow]tqdm not installed. Please install tqdm for progress bars.[/yellow]")
-        tqdm = None
+    # Parsed lazily: the first batches are sent while the file is still being read
+    options = iter_options(
+        args.from_file, use_cache=not getattr(args, "no_parse_cache", False)
+    )
+    console.print(f"Streaming options from {args.from_file}")
 
-    batch_indices = list(range(0, total, BATCH_SIZE))
-    use_tqdm = tqdm is not None
-    if use_tqdm:
-        pbar = tqdm(total=len(batch_indices), desc="Bulk updating", unit="batch")
-
-    def _cb(msg: str) -> None:
-        pass  # tqdm progress handled after each batch
-
-    import datetime
-    for idx, i in enumerate(batch_indices):
-        batch = options[i:i+BATCH_SIZE]
-        start_dt = datetime.datetime.now()
-        ts = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-        console.print(f"[dim]Batch starting at {ts}[/dim]")
-        # Refresh token at each batch
-        try:
-            svc.get_bearer_token()
-        except Exception as exc:
-            console.print(f"[bold red]Token refresh failed: {exc}[/bold red]")
-            break
-        report = svc.bulk_update_options(
+    def _run_batch(batch: list[OptionItem]) -> BatchReport:
+        return svc.bulk_update_options(
             batch,
             name,
             lang,
@@ -460,31 +996,26 @@ def cmd_bulk_update(svc: DataverseOptionSetService, args: argparse.Namespace) ->
             entity_logical_name=entity,
             attribute_logical_name=attribute,
             continue_on_error=args.continue_on_error,
-            progress_callback=_cb,
         )
-        end_dt = datetime.datetime.now()
-        duration = (end_dt - start_dt).total_seconds()
-        console.print(f"[dim]Batch finished at {end_dt.strftime('%Y-%m-%d %H:%M:%S')} (duration: {duration:.2f} seconds)[/dim]")
-        all_results.extend(report.results)
-        failed += report.failed
-        succeeded += report.succeeded
-        if use_tqdm:
-            pbar.update(1)
-    if use_tqdm:
-        pbar.close()
-
-    # Compose a single BatchReport for all batches
-    final_report = BatchReport(
-        results=all_results,
-        total=total,
-        succeeded=succeeded,
-        failed=failed,
-    )
-    _print_batch_report(final_report)
+
+    final_report, status_codes = _run_batches(
+        options,
+        _run_batch,
+        desc="Bulk updating",
+        max_workers=getattr(args, "max_workers", None) or DEFAULT_MAX_WORKERS,
+        report_out=getattr(args, "report_out", None),
+        keep_all=getattr(args, "verbose_report", False),
+        jsonl=getattr(args, "report_format", "table") == "jsonl",
+    )
+    _print_batch_report(
+        final_report, getattr(args, "report_format", "table"), status_codes
+    )
 
 
 def cmd_bulk_delete(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Bulk delete options from an OptionSet."""
+    from rich.prompt import Confirm, Prompt
+
     name = args.optionset or Prompt.ask("OptionSet schema name")
     entity = getattr(args, "entity", None)
     attribute = getattr(args, "attribute", None)
@@ -493,7 +1024,9 @@ def cmd_bulk_delete(svc: DataverseOptionSetService, args: argparse.Namespace) ->
         console.print("[red]--from-csv / --from-json is required for bulk delete[/red]")
         return
 
-    options = load_options(args.from_file)
+    options = load_options(
+        args.from_file, use_cache=not getattr(args, "no_parse_cache", False)
+    )
     console.print(f"Loaded [bold]{len(options)}[/bold] options from {args.from_file}")
 
     if not Confirm.ask(
@@ -501,72 +1034,38 @@ def cmd_bulk_delete(svc: DataverseOptionSetService, args: argparse.Namespace) ->
     ):
         return
 
-    BATCH_SIZE = 50
-    total = len(options)
-    all_results = []
-    failed = 0
-    succeeded = 0
-    from OptionSetHelper import BatchReport
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        console.print("[yellow]tqdm not installed. Please install tqdm for progress bars.[/yellow]")
-        tqdm = None
-
-    batch_indices = list(range(0, total, BATCH_SIZE))
-    use_tqdm = tqdm is not None
-    if use_tqdm:
-        pbar = tqdm(total=len(batch_indices), desc="Bulk deleting", unit="batch")
-
-    def _cb(msg: str) -> None:
-        pass
-
-    import datetime
-    for idx, i in enumerate(batch_indices):
-        batch = options[i:i+BATCH_SIZE]
-        start_dt = datetime.datetime.now()
-        ts = start_dt.strftime('%Y-%m-%d %H:%M:%S')
-        console.print(f"[dim]Batch starting at {ts}[/dim]")
-        # Refresh token at each batch
-        try:
-            svc.get_bearer_token()
-        except Exception as exc:
-            console.print(f"[bold red]Token refresh failed: {exc}[/bold red]")
-            break
-        report = svc.bulk_delete_options(
+    def _run_batch(batch: list[OptionItem]) -> BatchReport:
+        return svc.bulk_delete_options(
             batch,
             name,
             entity_logical_name=entity,
             attribute_logical_name=attribute,
             continue_on_error=True,
-            progress_callback=_cb,
         )
-        end_dt = datetime.datetime.now()
-        duration = (end_dt - start_dt).total_seconds()
-        console.print(f"[dim]Batch finished at {end_dt.strftime('%Y-%m-%d %H:%M:%S')} (duration: {duration:.2f} seconds)[/dim]")
-        all_results.extend(report.results)
-        failed += report.failed
-        succeeded += report.succeeded
-        if use_tqdm:
-            pbar.update(1)
-    if use_tqdm:
-        pbar.close()
-
-    # Compose a single BatchReport for all batches
-    final_report = BatchReport(
-        results=all_results,
-        total=total,
-        succeeded=succeeded,
-        failed=failed,
-    )
-    if all_results:
-        _print_batch_report(final_report)
+
+    final_report, status_codes = _run_batches(
+        options,
+        _run_batch,
+        desc="Bulk deleting",
+        max_workers=getattr(args, "max_workers", None) or DEFAULT_MAX_WORKERS,
+        report_out=getattr(args, "report_out", None),
+        keep_all=getattr(args, "verbose_report", False),
+        jsonl=getattr(args, "report_format", "table") == "jsonl",
+    )
+    if final_report.total:
+        _print_batch_report(
+            final_report, getattr(args, "report_format", "table"), status_codes
+        )
     else:
         console.print("[green]Nothing to delete.[/green]")
 
 
 def cmd_insert_single(svc: DataverseOptionSetService, args: argparse.Namespace) -> None:
     """Insert a single option into an OptionSet."""
+    from rich.prompt import IntPrompt, Prompt
+
+    from OptionSetHelper import OptionItem
+
     name = args.optionset or Prompt.ask("OptionSet schema name")
     entity = getattr(args, "entity", None)
     attribute = getattr(args, "attribute", None)
@@ -591,8 +1090,12 @@ def cmd_insert_single(svc: DataverseOptionSetService, args: argparse.Namespace)
     )
 
 
-def cmd_interactive(svc: DataverseOptionSetService) -> None:
+def cmd_interactive(svc: DataverseOptionSetService, *, no_cache: bool = False) -> None:
     """Interactive menu-driven mode."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.prompt import Confirm, Prompt
+
     commands = {
         "1": ("List global OptionSets", cmd_list_global),
         "2": ("Search OptionSets by label", cmd_search),
@@ -641,6 +1144,11 @@ def cmd_interactive(svc: DataverseOptionSetService) -> None:
             merge_labels=False,
             item_label=None,
             item_value=None,
+            max_workers=DEFAULT_MAX_WORKERS,
+            report_out=None,
+            report_format="table",
+            verbose_report=False,
+            no_cache=no_cache,
         )
 
         # For file-based commands, ask for file path
@@ -663,6 +1171,19 @@ def cmd_interactive(svc: DataverseOptionSetService) -> None:
             handler(svc, ns)
         except Exception as exc:
             console.print(f"[bold red]Error: {exc}[/bold red]")
+        finally:
+            if handler in _MUTATING_COMMANDS:
+                _clear_cache()
+
+
+# Commands that change metadata and therefore invalidate the disk cache
+_MUTATING_COMMANDS = {
+    cmd_create_global,
+    cmd_insert_single,
+    cmd_bulk_insert,
+    cmd_bulk_update,
+    cmd_bulk_delete,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -672,6 +1193,8 @@ def cmd_interactive(svc: DataverseOptionSetService) -> None:
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Dataverse OptionSet Helper CLI",
+        epilog="Optional speed-ups: install orjson (JSON decoding), ijson "
+        "(streamed JSON input) and pyarrow (large CSV input).",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -685,9 +1208,42 @@ def build_parser() -> argparse.ArgumentParser:
         default=1033,
         help="Language code for labels (default: 1033 = English)",
     )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Log per-batch timings and service debug output",
+    )
+    parser.add_argument(
+        "--force-refresh-token",
+        action="store_true",
+        help="Fetch a new bearer token instead of reusing a cached one",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Send requests over HTTP/2 with httpx (requires httpx[http2]); "
+        "note that this transport does not retry failed GETs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk metadata cache",
+    )
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Don't read or write the parquet cache of parsed CSV option files",
+    )
 
     sub = parser.add_subparsers(dest="command")
 
+    # --- cache ---
+    p_cache = sub.add_parser(
+        "cache", help="Manage the on-disk metadata and parsed-file caches"
+    )
+    p_cache.add_argument("action", choices=["clear"])
+
     # --- list-global ---
     sub.add_parser("list-global", help="List all global OptionSets")
 
@@ -722,6 +1278,28 @@ def build_parser() -> argparse.ArgumentParser:
     p_bi.add_argument("--entity", required=False)
     p_bi.add_argument("--attribute", required=False)
     p_bi.add_argument("--continue-on-error", action="store_true")
+    p_bi.add_argument(
+        "--report-format",
+        choices=["table", "summary", "jsonl"],
+        default="table",
+        help="How to print the results (default: table)",
+    )
+    p_bi.add_argument(
+        "--verbose-report",
+        action="store_true",
+        help="List every result row, not only the failures",
+    )
+    p_bi.add_argument(
+        "--report-out",
+        required=False,
+        help="Write every result row to this CSV file as batches complete",
+    )
+    p_bi.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent $batch requests (default: {DEFAULT_MAX_WORKERS})",
+    )
     p_bi.add_argument(
         "--no-safe",
         dest="safe",
@@ -737,6 +1315,28 @@ def build_parser() -> argparse.ArgumentParser:
     p_bu.add_argument("--attribute", required=False)
     p_bu.add_argument("--merge-labels", action="store_true")
     p_bu.add_argument("--continue-on-error", action="store_true")
+    p_bu.add_argument(
+        "--report-format",
+        choices=["table", "summary", "jsonl"],
+        default="table",
+        help="How to print the results (default: table)",
+    )
+    p_bu.add_argument(
+        "--verbose-report",
+        action="store_true",
+        help="List every result row, not only the failures",
+    )
+    p_bu.add_argument(
+        "--report-out",
+        required=False,
+        help="Write every result row to this CSV file as batches complete",
+    )
+    p_bu.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent $batch requests (default: {DEFAULT_MAX_WORKERS})",
+    )
 
     # --- bulk-delete ---
     p_bd = sub.add_parser("bulk-delete", help="Batch delete options")
@@ -745,6 +1345,28 @@ def build_parser() -> argparse.ArgumentParser:
     p_bd.add_argument("--entity", required=False)
     p_bd.add_argument("--attribute", required=False)
     p_bd.add_argument("--continue-on-error", action="store_true")
+    p_bd.add_argument(
+        "--report-format",
+        choices=["table", "summary", "jsonl"],
+        default="table",
+        help="How to print the results (default: table)",
+    )
+    p_bd.add_argument(
+        "--verbose-report",
+        action="store_true",
+        help="List every result row, not only the failures",
+    )
+    p_bd.add_argument(
+        "--report-out",
+        required=False,
+        help="Write every result row to this CSV file as batches complete",
+    )
+    p_bd.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Concurrent $batch requests (default: {DEFAULT_MAX_WORKERS})",
+    )
 
     return parser
 
@@ -757,6 +1379,19 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.verbose:
+        logging.basicConfig(format="%(asctime)s %(name)s: %(message)s")
+        for name in ("bulk", "OptionSetHelper"):
+            logging.getLogger(name).setLevel(logging.DEBUG)
+
+    if getattr(args, "report_format", "table") == "jsonl":
+        _LazyConsole.stderr = True  # stdout carries only the JSON records
+
+    from rich import box
+    from rich.panel import Panel
+
+    from OptionSetHelper import create_service_from_env
+
     console.print(
         Panel(
             "[bold cyan]Dataverse OptionSet Helper[/bold cyan]\n"
@@ -765,12 +1400,22 @@ def main() -> None:
         )
     )
 
+    if args.command == "cache":
+        removed = _clear_cache(parsed=True)
+        console.print(f"[green]Cleared {removed} cached entr{'y' if removed == 1 else 'ies'}[/green]")
+        return
+
     # Initialise service
     env_path = args.env
     try:
         with console.status("[bold cyan]Authenticating …"):
-            svc = create_service_from_env(env_path)
-            svc.get_bearer_token()
+            # Keep a pooled connection per concurrent bulk worker
+            svc = create_service_from_env(
+                env_path,
+                transport="httpx" if args.http2 else "requests",
+                pool_maxsize=max(32, getattr(args, "max_workers", 0) or 0),
+            )
+            svc.get_bearer_token(force_new=args.force_refresh_token)
         console.print("[green]✅ Authenticated successfully[/green]\n")
     except Exception as exc:
         console.print(f"[bold red]Authentication failed: {exc}[/bold red]")
@@ -788,14 +1433,19 @@ def main() -> None:
         "bulk-delete": cmd_bulk_delete,
     }
 
-    if args.command and args.command in cmd_map:
-        try:
-            cmd_map[args.command](svc, args)
-        except Exception as exc:
-            console.print(f"[bold red]Error: {exc}[/bold red]")
-            sys.exit(1)
-    else:
-        cmd_interactive(svc)
+    with svc:
+        if args.command and args.command in cmd_map:
+            handler = cmd_map[args.command]
+            try:
+                handler(svc, args)
+            except Exception as exc:
+                console.print(f"[bold red]Error: {exc}[/bold red]")
+                sys.exit(1)
+            finally:
+                if handler in _MUTATING_COMMANDS:
+                    _clear_cache()
+        else:
+            cmd_interactive(svc, no_cache=args.no_cache)
 
 
 if __name__ == "__main__":
@@ -4,18 +4,25 @@ and shows the main window.
 """
 from __future__ import annotations
 
-import os
+import functools
 import sys
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 
-from optionset_qt.main_window import MainWindow
+_HERE = Path(__file__).resolve()
+_ASSETS_DIR = _HERE.parent / "assets"
 
+# Ensure the OptionSetHelper package can be found (done once, at import time,
+# before main_window pulls in the controllers that import it)
+_REPO_ROOT = str(_HERE.parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-_ASSETS_DIR = Path(__file__).resolve().parent / "assets"
+from optionset_qt.main_window import MainWindow  # noqa: E402
 
 
+@functools.cache
 def _load_stylesheet() -> str:
     qss = _ASSETS_DIR / "styles.qss"
     if qss.is_file():
@@ -25,11 +32,6 @@ def _load_stylesheet() -> str:
 
 def run() -> int:
     """Entry-point called by main.py."""
-    # Ensure the OptionSetHelper package can be found
-    parent = str(Path(__file__).resolve().parents[2])
-    if parent not in sys.path:
-        sys.path.insert(0, parent)
-
     app = QApplication(sys.argv)
     app.setApplicationName("Dataverse OptionSet Helper")
     app.setOrganizationName("OptionSetHelper")
@@ -1,19 +1,27 @@
 """
 Background workers and business-logic controller.
 
-All long-running Dataverse calls are executed in QThread workers so the
-GUI stays responsive.  Workers emit signals that the MainWindow connects
-to for updating the UI.
+All long-running Dataverse calls are executed as QRunnable workers on a
+shared QThreadPool so the GUI stays responsive.  Each worker owns a
+WorkerSignals emitter that the MainWindow connects to for updating the UI.
 """
 from __future__ import annotations
 
+import contextlib
 import csv
-import datetime
+import functools
+import io
+import itertools
 import json
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import SIGNAL, QObject, QRunnable, Signal
 
 from OptionSetHelper import (
     BatchReport,
@@ -21,8 +29,20 @@ from OptionSetHelper import (
     OptionItem,
     create_service_from_env,
 )
+from optionset_qt.models.optionset_model import extract_optionset_infos_from_stream
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+_loads = orjson.loads if orjson is not None else json.loads
 
 BATCH_SIZE = 50
+MAX_CONCURRENT_BATCHES = 4      # batches in flight at once in BulkOperationWorker
+TOKEN_REFRESH_MARGIN = 120.0    # seconds of validity a batch needs before starting
+MMAP_THRESHOLD = 1 << 20        # files above this size are memory-mapped
+_BOM = b"\xef\xbb\xbf"
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 # ── CSV / JSON loader (same logic as cli.py) ────────────────────────
@@ -33,47 +53,354 @@ def load_options_from_file(path: str) -> list[OptionItem]:
     return _load_csv(path)
 
 
-def _load_csv(path: str) -> list[OptionItem]:
-    items: list[OptionItem] = []
-    with open(path, newline="", encoding="utf-8-sig") as fh:
-        sample = fh.read(2048)
-        fh.seek(0)
-        sniffer = csv.Sniffer()
+@contextlib.contextmanager
+def _open_mapped(path: str) -> Iterator[mmap.mmap | None]:
+    """Map *path* read-only when it is larger than MMAP_THRESHOLD, else yield None."""
+    if os.path.getsize(path) <= MMAP_THRESHOLD:
+        yield None
+        return
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        yield mm
+
+
+def _is_int(cell: str) -> bool:
+    return cell.strip().lstrip("-").isdigit()
+
+
+def _append_row(row: list[str], items: list[OptionItem]) -> None:
+    """Apply the CSV row rules to a single row of any shape."""
+    n = len(row)
+    if n >= 3:
         try:
-            dialect = sniffer.sniff(sample)
-        except csv.Error:
-            dialect = csv.excel
-        has_header = sniffer.has_header(sample)
-        reader = csv.reader(fh, dialect)
-        if has_header:
-            next(reader)
-        for row in reader:
-            if not row:
+            val = int(row[0])
+        except ValueError:
+            try:
+                val = int(row[2])
+            except ValueError:
+                return
+        items.append(OptionItem(label=row[1].strip(), value=val))
+    elif n == 2:
+        try:
+            val = int(row[1])
+        except ValueError:
+            return
+        items.append(OptionItem(label=row[0].strip(), value=val))
+    elif n == 1:
+        items.append(OptionItem(label=row[0].strip(), value=len(items)))
+
+
+def _append_rows(rows: Iterable[list[str]], items: list[OptionItem]) -> None:
+    """
+    Apply the CSV row rules to *rows*, appending the resulting options.
+
+    The width of the first non-empty row picks a loop specialised for that
+    shape; the odd row of another width goes through _append_row.
+    """
+    rows = iter(rows)
+    first = next((r for r in rows if r), None)
+    if first is None:
+        return
+    _append_row(first, items)
+
+    _int = int
+    _OI = OptionItem
+    _app = items.append
+    _other = _append_row
+    width = len(first)
+    if width >= 3 and not first[0].rstrip()[-1:].isdigit():
+        # "col0, label, value" files: skip the doomed int(col0) unless the
+        # cell ends in a digit (int() never accepts anything else)
+        for row in rows:
+            if len(row) < 3:
+                _other(row, items)
                 continue
-            row = [c.strip() for c in row]
-            if len(row) >= 3:
-                try:
-                    val = int(row[0]); label = row[1]
-                except ValueError:
-                    try:
-                        val = int(row[2]); label = row[1]
-                    except ValueError:
-                        continue
-                items.append(OptionItem(label=label, value=val))
-            elif len(row) == 2:
+            if row[0].rstrip()[-1:].isdigit():
+                _other(row, items)
+                continue
+            try:
+                val = _int(row[2])
+            except ValueError:
+                continue
+            _app(_OI(label=row[1].strip(), value=val))
+    elif width >= 3:
+        for row in rows:
+            if len(row) < 3:
+                _other(row, items)
+                continue
+            try:
+                val = _int(row[0])
+            except ValueError:
                 try:
-                    val = int(row[1]); label = row[0]
+                    val = _int(row[2])
                 except ValueError:
                     continue
-                items.append(OptionItem(label=label, value=val))
-            elif len(row) == 1:
-                items.append(OptionItem(label=row[0], value=len(items)))
+            _app(_OI(label=row[1].strip(), value=val))
+    elif width == 2:
+        for row in rows:
+            if len(row) != 2:
+                _other(row, items)
+                continue
+            try:
+                val = _int(row[1])
+            except ValueError:
+                continue
+            _app(_OI(label=row[0].strip(), value=val))
+    else:
+        for row in rows:
+            if len(row) != 1:
+                _other(row, items)
+                continue
+            _app(_OI(label=row[0].strip(), value=len(items)))
+
+
+@functools.cache
+def _row_scanner() -> tuple[Callable, Callable] | None:
+    """
+    Build the Numba-compiled ``(scan, char_offsets)`` kernels used for large
+    CSV files, or return ``None`` when numba / numpy are not installed.
+    """
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, inline="always")
+    def _atoi(buf, lo, hi):
+        # -> (status, value): 1 = int, 0 = not an int, 2 = let Python decide
+        while lo < hi and (buf[lo] == 32 or 9 <= buf[lo] <= 13):
+            lo += 1
+        while hi > lo and (buf[hi - 1] == 32 or 9 <= buf[hi - 1] <= 13):
+            hi -= 1
+        neg = False
+        if lo < hi and (buf[lo] == 43 or buf[lo] == 45):
+            neg = buf[lo] == 45
+            lo += 1
+        if lo == hi:
+            return 0, 0
+        if hi - lo > 18:
+            return 2, 0
+        val = 0
+        for k in range(lo, hi):
+            c = buf[k]
+            if c >= 128 or c == 95:        # non-ASCII digits, "1_000"
+                return 2, 0
+            if c < 48 or c > 57:
+                return 0, 0
+            val = val * 10 + (c - 48)
+        return 1, -val if neg else val
+
+    @numba.njit(cache=True)
+    def scan(buf, pos):
+        n = buf.shape[0]
+        cap = 1
+        for k in range(pos, n):
+            if buf[k] == 10:
+                cap += 1
+        # kind: 0 = skip, 1 = option, 2 = auto-numbered, 3 = parse in Python
+        kind = np.zeros(cap, np.int8)
+        values = np.zeros(cap, np.int64)
+        bounds = np.zeros((cap, 4), np.int64)     # line lo/hi, label lo/hi
+        is_ascii = True
+        for k in range(pos, n):
+            if buf[k] >= 128:
+                is_ascii = False
+                break
+        rows = 0
+        while pos < n:
+            eol = pos
+            while eol < n and buf[eol] != 10:
+                eol += 1
+            hi = eol - 1 if eol > pos and buf[eol - 1] == 13 else eol
+            for k in range(pos, hi):
+                if buf[k] == 13:                  # bare CR: csv would reject it
+                    return kind[:0], values[:0], bounds[:0], False, is_ascii
+            c1 = -1
+            c2 = -1
+            c3 = -1
+            for k in range(pos, hi):
+                if buf[k] == 44:
+                    if c1 < 0:
+                        c1 = k
+                    elif c2 < 0:
+                        c2 = k
+                    elif c3 < 0:
+                        c3 = k
+                        break
+            bounds[rows, 0] = pos
+            bounds[rows, 1] = hi
+            if hi == pos:
+                kind[rows] = 0
+                bounds[rows, 2] = pos
+                bounds[rows, 3] = pos
+            elif c1 < 0:
+                kind[rows] = 2
+                bounds[rows, 2] = pos
+                bounds[rows, 3] = hi
+            elif c2 < 0:
+                st, v = _atoi(buf, c1 + 1, hi)
+                kind[rows] = 3 if st == 2 else st
+                values[rows] = v
+                bounds[rows, 2] = pos
+                bounds[rows, 3] = c1
+            else:
+                st, v = _atoi(buf, pos, c1)
+                if st == 0:
+                    st, v = _atoi(buf, c2 + 1, c3 if c3 >= 0 else hi)
+                kind[rows] = 3 if st == 2 else st
+                values[rows] = v
+                bounds[rows, 2] = c1 + 1
+                bounds[rows, 3] = c2
+            # trim ASCII whitespace around the label (str.strip does the rest)
+            lo = bounds[rows, 2]
+            hi = bounds[rows, 3]
+            while lo < hi and (buf[lo] == 32 or 9 <= buf[lo] <= 13 or 28 <= buf[lo] <= 31):
+                lo += 1
+            while hi > lo and (buf[hi - 1] == 32 or 9 <= buf[hi - 1] <= 13 or 28 <= buf[hi - 1] <= 31):
+                hi -= 1
+            bounds[rows, 2] = lo
+            bounds[rows, 3] = hi
+            rows += 1
+            pos = eol + 1
+        return kind[:rows], values[:rows], bounds[:rows], True, is_ascii
+
+    @numba.njit(cache=True)
+    def char_offsets(buf, pos, offsets):
+        # Map ascending byte offsets to character offsets in buf[pos:] decoded
+        # as UTF-8, by counting the bytes that start a character
+        out = np.empty_like(offsets)
+        chars = 0
+        b = pos
+        for k in range(offsets.shape[0]):
+            target = offsets[k]
+            while b < target:
+                if (buf[b] & 0xC0) != 0x80:
+                    chars += 1
+                b += 1
+            out[k] = chars
+        return out
+
+    return scan, char_offsets
+
+
+def _can_scan_bytes(mm: mmap.mmap, start: int, dialect: Any) -> bool:
+    """True when a plain comma split of the raw bytes matches csv.reader."""
+    if dialect.delimiter != "," or dialect.escapechar is not None:
+        return False
+    quote = dialect.quotechar
+    return not quote or mm.find(quote.encode(), start) == -1
+
+
+def _scan_mapped_rows(
+    mm: mmap.mmap, pos: int, dialect: Any, items: list[OptionItem],
+) -> bool:
+    """
+    Parse the rows of *mm* from *pos* with the compiled scanner.  Returns
+    ``False`` (having appended nothing) when the scanner is unavailable or
+    hits bytes it cannot handle, so the caller falls back to csv.reader.
+    """
+    kernels = _row_scanner()
+    if kernels is None:
+        return False
+    scan, char_offsets = kernels
+    import numpy as np
+
+    buf = np.frombuffer(mm, dtype=np.uint8)
+    kinds, values, bounds, ok, is_ascii = scan(buf, pos)
+    if not ok:
+        return False
+    # Decode the file once and slice labels out of the text; the scanner
+    # has already trimmed the ASCII whitespace around them
+    if is_ascii:
+        # everything from *pos* on is ASCII, so latin-1 keeps byte offsets
+        # equal to character offsets
+        text = mm[:].decode("latin-1")
+        spans = bounds[:, 2:]
+    else:
+        text = mm[pos:].decode("utf-8")
+        spans = char_offsets(buf, pos, bounds[:, 2:].ravel()).reshape(-1, 2)
+    # (1-D .tolist() is much cheaper than a nested list of pairs)
+    labels = [text[lo:hi] for lo, hi in zip(spans[:, 0].tolist(), spans[:, 1].tolist())]
+    if not is_ascii:
+        labels = [label.strip() for label in labels]   # e.g. NBSP
+    del buf
+
+    _OI = OptionItem
+    if (kinds == 1).all():
+        items.extend(map(_OI, labels, values.tolist()))
+        return True
+    _app = items.append
+    for kind, val, label, lo, hi in zip(
+        kinds.tolist(), values.tolist(), labels, bounds[:, 0].tolist(), bounds[:, 1].tolist()
+    ):
+        if kind == 1:
+            _app(_OI(label, val))
+        elif kind == 2:
+            _app(_OI(label, len(items)))
+        elif kind == 3:
+            _append_rows(csv.reader([mm[lo:hi].decode("utf-8")], dialect), items)
+    return True
+
+
+def _load_csv(path: str, dialect: Any = None) -> list[OptionItem]:
+    """
+    Parse a CSV options file.
+
+    When *dialect* is not given it is sniffed from the first 1 KB, falling
+    back to ``csv.excel``.  A multi-column first row without any integer
+    cell is treated as a header.  Large files are read through an mmap and,
+    when numba is installed and the file has no quoting, split by the
+    compiled byte scanner instead of csv.reader.
+    """
+    items: list[OptionItem] = []
+    with contextlib.ExitStack() as stack:
+        mm = stack.enter_context(_open_mapped(path))
+        if mm is None:
+            fh = stack.enter_context(open(path, newline="", encoding="utf-8-sig"))
+            if dialect is None:
+                sample = fh.read(1024)
+                fh.seek(0)
+            lines: Any = fh
+        else:
+            start = 3 if mm[:3] == _BOM else 0
+            if dialect is None:
+                sample = mm[start : start + 1024].decode("utf-8", "ignore")
+            mm.seek(start)
+            lines = (line.decode("utf-8") for line in iter(mm.readline, b""))
+        if dialect is None:
+            try:
+                dialect = csv.Sniffer().sniff(sample)
+            except csv.Error:
+                dialect = csv.excel
+        reader = csv.reader(lines, dialect)
+        first = next(reader, None)
+        if first is None:
+            return items
+        has_header = len(first) > 1 and not any(_is_int(c) for c in first)
+        if not has_header:
+            reader = itertools.chain([first], reader)
+
+        if (
+            mm is not None
+            and _can_scan_bytes(mm, start, dialect)
+            and _scan_mapped_rows(mm, mm.tell() if has_header else start, dialect, items)
+        ):
+            return items
+        _append_rows(reader, items)
     return items
 
 
 def _load_json(path: str) -> list[OptionItem]:
-    with open(path, encoding="utf-8-sig") as fh:
-        data = json.load(fh)
+    with _open_mapped(path) as mm:
+        if mm is None:
+            data = _loads(Path(path).read_bytes().removeprefix(_BOM))
+        else:
+            start = 3 if mm[:3] == _BOM else 0
+            with memoryview(mm)[start:] as view:
+                # orjson parses straight from the mapping; json.loads needs bytes
+                data = _loads(view if orjson is not None else bytes(view))
     items: list[OptionItem] = []
     if isinstance(data, list):
         for e in data:
@@ -85,57 +412,64 @@ def _load_json(path: str) -> list[OptionItem]:
 
 
 # ═══════════════════════════════════════════════════════════════════
-# Workers (run inside QThread)
+# Workers (run inside a QThreadPool)
 # ═══════════════════════════════════════════════════════════════════
 
-class AuthWorker(QObject):
-    """Authenticate with Dataverse."""
-    finished = Signal(object)       # DataverseOptionSetService | None
+class WorkerSignals(QObject):
+    """Signals shared by all workers (QRunnable cannot emit on its own)."""
+    finished = Signal(object)
     error = Signal(str)
     log = Signal(str)
+    progress = Signal(int, int)          # (current_batch, total_batches)
+    batch_log = Signal(str)              # per-batch log line
+
+    def connected(self, signature: str) -> bool:
+        """True if any slot listens to *signature*, e.g. ``"log(QString)"``."""
+        return self.receivers(SIGNAL(signature)) > 0
+
+
+class AuthWorker(QRunnable):
+    """Authenticate with Dataverse."""
 
     def __init__(self, env_path: str):
         super().__init__()
+        self.signals = WorkerSignals()
         self.env_path = env_path
 
     def run(self) -> None:
         try:
-            self.log.emit("Authenticating …")
+            self.signals.log.emit("Authenticating …")
             svc = create_service_from_env(self.env_path)
             svc.get_bearer_token()
-            self.log.emit("✅ Authenticated successfully")
-            self.finished.emit(svc)
+            self.signals.log.emit("✅ Authenticated successfully")
+            self.signals.finished.emit(svc)
         except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit(None)
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit(None)
 
 
-class ListGlobalWorker(QObject):
-    """Fetch all global OptionSets."""
-    finished = Signal(list)
-    error = Signal(str)
-    log = Signal(str)
+class ListGlobalWorker(QRunnable):
+    """Fetch all global OptionSets and parse them into OptionSetInfo objects."""
 
     def __init__(self, svc: DataverseOptionSetService):
         super().__init__()
+        self.signals = WorkerSignals()
         self.svc = svc
 
     def run(self) -> None:
         try:
-            self.log.emit("Fetching global OptionSets …")
-            data = self.svc.list_global_optionsets()
-            self.log.emit(f"Received {len(data)} OptionSets")
-            self.finished.emit(data)
+            self.signals.log.emit("Fetching global OptionSets …")
+            body = self.svc.list_global_optionsets_raw()
+            infos = extract_optionset_infos_from_stream(io.BytesIO(body))
+            self.signals.log.emit(f"Received {len(infos)} OptionSets")
+            self.signals.finished.emit(infos)
         except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit([])
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit([])
 
 
-class FetchOptionsWorker(QObject):
+class FetchOptionsWorker(QRunnable):
     """Fetch options for a single OptionSet."""
-    finished = Signal(list)
-    error = Signal(str)
-    log = Signal(str)
 
     def __init__(
         self,
@@ -145,6 +479,7 @@ class FetchOptionsWorker(QObject):
         attribute: str | None = None,
     ):
         super().__init__()
+        self.signals = WorkerSignals()
         self.svc = svc
         self.name = name
         self.entity = entity
@@ -152,24 +487,21 @@ class FetchOptionsWorker(QObject):
 
     def run(self) -> None:
         try:
-            self.log.emit(f"Fetching options for '{self.name}' …")
+            self.signals.log.emit(f"Fetching options for '{self.name}' …")
             opts = self.svc.get_optionset_options(
                 self.name,
                 entity_logical_name=self.entity,
                 attribute_logical_name=self.attribute,
             )
-            self.log.emit(f"'{self.name}' has {len(opts)} option(s)")
-            self.finished.emit(opts)
+            self.signals.log.emit(f"'{self.name}' has {len(opts)} option(s)")
+            self.signals.finished.emit(opts)
         except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit([])
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit([])
 
 
-class CreateGlobalWorker(QObject):
+class CreateGlobalWorker(QRunnable):
     """Create a new global OptionSet."""
-    finished = Signal(bool)
-    error = Signal(str)
-    log = Signal(str)
 
     def __init__(
         self,
@@ -180,6 +512,7 @@ class CreateGlobalWorker(QObject):
         language_code: int = 1033,
     ):
         super().__init__()
+        self.signals = WorkerSignals()
         self.svc = svc
         self.name = name
         self.display_label = display_label
@@ -188,24 +521,21 @@ class CreateGlobalWorker(QObject):
 
     def run(self) -> None:
         try:
-            self.log.emit(f"Creating global OptionSet '{self.name}' …")
+            self.signals.log.emit(f"Creating global OptionSet '{self.name}' …")
             resp = self.svc.create_global_optionset(
                 self.name, self.display_label, self.options, self.language_code,
             )
-            self.log.emit(
+            self.signals.log.emit(
                 f"✅ Created '{self.name}' ({len(self.options)} options) – HTTP {resp.status_code}"
             )
-            self.finished.emit(True)
+            self.signals.finished.emit(True)
         except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit(False)
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit(False)
 
 
-class InsertSingleWorker(QObject):
+class InsertSingleWorker(QRunnable):
     """Insert a single option."""
-    finished = Signal(bool)
-    error = Signal(str)
-    log = Signal(str)
 
     def __init__(
         self,
@@ -217,6 +547,7 @@ class InsertSingleWorker(QObject):
         attribute: str | None = None,
     ):
         super().__init__()
+        self.signals = WorkerSignals()
         self.svc = svc
         self.option = option
         self.optionset_name = optionset_name
@@ -226,7 +557,7 @@ class InsertSingleWorker(QObject):
 
     def run(self) -> None:
         try:
-            self.log.emit(f"Inserting '{self.option.label}' = {self.option.value} …")
+            self.signals.log.emit(f"Inserting '{self.option.label}' = {self.option.value} …")
             resp = self.svc.insert_option(
                 self.option,
                 self.optionset_name,
@@ -234,26 +565,22 @@ class InsertSingleWorker(QObject):
                 entity_logical_name=self.entity,
                 attribute_logical_name=self.attribute,
             )
-            self.log.emit(f"✅ Inserted – HTTP {resp.status_code}")
-            self.finished.emit(True)
+            self.signals.log.emit(f"✅ Inserted – HTTP {resp.status_code}")
+            self.signals.finished.emit(True)
         except Exception as exc:
-            self.error.emit(str(exc))
-            self.finished.emit(False)
+            self.signals.error.emit(str(exc))
+            self.signals.finished.emit(False)
 
 
 # ── Generic batched bulk worker ─────────────────────────────────────
 
-class BulkOperationWorker(QObject):
+class BulkOperationWorker(QRunnable):
     """
-    Runs a bulk insert / update / delete in batches of BATCH_SIZE,
-    refreshing the token at each batch.
+    Runs a bulk insert / update / delete in batches of BATCH_SIZE, up to
+    MAX_CONCURRENT_BATCHES at a time, refreshing the token only when it is
+    close to expiry.
     Emits progress and log signals.
     """
-    progress = Signal(int, int)          # (current_batch, total_batches)
-    batch_log = Signal(str)              # per-batch log line
-    finished = Signal(object)            # final BatchReport
-    error = Signal(str)
-    log = Signal(str)
 
     def __init__(
         self,
@@ -269,6 +596,7 @@ class BulkOperationWorker(QObject):
         continue_on_error: bool = True,
     ):
         super().__init__()
+        self.signals = WorkerSignals()
         self.svc = svc
         self.options = options
         self.optionset_name = optionset_name
@@ -279,57 +607,102 @@ class BulkOperationWorker(QObject):
         self.safe_insert = safe_insert
         self.merge_labels = merge_labels
         self.continue_on_error = continue_on_error
+        self._cancel = threading.Event()
+        self._call = self._bind_operation()
+
+    def cancel(self) -> None:
+        """Stop before the next batch (pooled runnables have no interruption flag)."""
+        self._cancel.set()
 
     def run(self) -> None:
         total = len(self.options)
-        batch_indices = list(range(0, total, BATCH_SIZE))
-        n_batches = len(batch_indices)
-
-        all_results: list = []
-        failed = 0
-        succeeded = 0
-
-        self.log.emit(
+        options = self.options
+        if self.operation == "insert" and self.safe_insert:
+            # De-duplicate once up front: batches run concurrently, so a
+            # per-batch check could not see values another batch inserts
+            try:
+                options = self._drop_duplicates(options)
+            except Exception as exc:
+                self.signals.error.emit(f"Could not read existing values: {exc}")
+                self.signals.finished.emit(None)
+                return
+        n_batches = -(-len(options) // BATCH_SIZE)
+
+        reports: list[BatchReport | None] = [None] * n_batches
+        stop = threading.Event()          # set on a hard failure
+        # skip per-batch signals (and building their strings) nobody listens to
+        log_batches = self.signals.connected("batch_log(QString)")
+        report_progress = self.signals.connected("progress(int,int)")
+
+        self.signals.log.emit(
             f"Starting bulk {self.operation} – {total} option(s) in {n_batches} batch(es) of {BATCH_SIZE}"
         )
 
         def _noop(msg: str) -> None:
             pass
 
-        for batch_num, i in enumerate(batch_indices, start=1):
-            batch = self.options[i : i + BATCH_SIZE]
-            start_dt = datetime.datetime.now()
-            ts = start_dt.strftime("%Y-%m-%d %H:%M:%S")
-            self.batch_log.emit(f"[{ts}] Batch {batch_num}/{n_batches} starting ({len(batch)} items)")
+        def _do_batch(batch_num: int) -> BatchReport | None:
+            if self._cancel.is_set() or stop.is_set():
+                return None
+            i = (batch_num - 1) * BATCH_SIZE
+            batch = options[i : i + BATCH_SIZE]
+            start = time.monotonic()
+            if log_batches:
+                self.signals.batch_log.emit(
+                    f"[{time.strftime(_TS_FORMAT)}] Batch {batch_num}/{n_batches} starting ({len(batch)} items)"
+                )
 
-            # Refresh token
+            # Refresh the token only when it is about to expire; the service
+            # serialises concurrent refreshes behind its token lock
             try:
-                self.svc.get_bearer_token()
+                if time.time() > self.svc.token_expires_at - TOKEN_REFRESH_MARGIN:
+                    self.svc.get_bearer_token(min_ttl=TOKEN_REFRESH_MARGIN)
             except Exception as exc:
-                self.error.emit(f"Token refresh failed: {exc}")
-                break
+                self.signals.error.emit(f"Token refresh failed: {exc}")
+                stop.set()
+                return None
 
-            try:
-                report = self._run_batch(batch, _noop)
-            except Exception as exc:
-                self.error.emit(f"Batch {batch_num} failed: {exc}")
-                if not self.continue_on_error:
-                    break
-                report = None
-
-            end_dt = datetime.datetime.now()
-            duration = (end_dt - start_dt).total_seconds()
-
-            if report is not None:
-                all_results.extend(report.results)
-                failed += report.failed
-                succeeded += report.succeeded
-
-            self.batch_log.emit(
-                f"[{end_dt.strftime('%Y-%m-%d %H:%M:%S')}] Batch {batch_num}/{n_batches} finished "
-                f"(duration: {duration:.2f}s)"
-            )
-            self.progress.emit(batch_num, n_batches)
+            report = self._run_batch(batch, _noop)
+
+            if log_batches:
+                duration = time.monotonic() - start
+                self.signals.batch_log.emit(
+                    f"[{time.strftime(_TS_FORMAT)}] Batch {batch_num}/{n_batches} finished "
+                    f"(duration: {duration:.2f}s)"
+                )
+            return report
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as pool:
+            futures = {
+                pool.submit(_do_batch, batch_num): batch_num
+                for batch_num in range(1, n_batches + 1)
+            }
+            for done, fut in enumerate(as_completed(futures), start=1):
+                batch_num = futures[fut]
+                try:
+                    reports[batch_num - 1] = fut.result()
+                except Exception as exc:
+                    self.signals.error.emit(f"Batch {batch_num} failed: {exc}")
+                    if not self.continue_on_error:
+                        stop.set()
+                if report_progress:
+                    self.signals.progress.emit(done, n_batches)
+
+        if self._cancel.is_set():
+            self.signals.log.emit(f"Bulk {self.operation} cancelled")
+
+        # one allocation for the merged results instead of repeated regrowth
+        done_reports = [r for r in reports if r is not None]
+        all_results: list = [None] * sum(len(r.results) for r in done_reports)
+        failed = 0
+        succeeded = 0
+        write_pos = 0
+        for report in done_reports:
+            n = len(report.results)
+            all_results[write_pos : write_pos + n] = report.results
+            write_pos += n
+            failed += report.failed
+            succeeded += report.succeeded
 
         final = BatchReport(
             results=all_results,
@@ -337,55 +710,61 @@ class BulkOperationWorker(QObject):
             succeeded=succeeded,
             failed=failed,
         )
-        self.log.emit(
+        self.signals.log.emit(
             f"Bulk {self.operation} complete – {succeeded}/{total} succeeded, {failed} failed"
         )
-        self.finished.emit(final)
+        self.signals.finished.emit(final)
+
+    def _drop_duplicates(self, options: list[OptionItem]) -> list[OptionItem]:
+        """Drop options whose value already exists or repeats in *options*."""
+        existing = self.svc.get_existing_values(
+            self.optionset_name,
+            entity_logical_name=self.entity,
+            attribute_logical_name=self.attribute,
+        )
+        seen: set[int] = set()
+        kept: list[OptionItem] = []
+        for o in options:
+            if o.value in existing or o.value in seen:
+                continue
+            seen.add(o.value)
+            kept.append(o)
+        if len(kept) < len(options) and self.signals.connected("batch_log(QString)"):
+            self.signals.batch_log.emit(f"  ⚠ Skipped {len(options) - len(kept)} duplicate(s)")
+        return kept
 
     # ── dispatch to the right service method ────────────────────
-    def _run_batch(self, batch: list[OptionItem], cb: Any) -> BatchReport | None:
+    def _bind_operation(self) -> Callable[..., BatchReport] | None:
+        """Resolve the service method for ``operation`` once, with its fixed kwargs."""
+        common = dict(
+            entity_logical_name=self.entity,
+            attribute_logical_name=self.attribute,
+            continue_on_error=self.continue_on_error,
+        )
         if self.operation == "insert":
-            if self.safe_insert:
-                report, skipped = self.svc.safe_bulk_insert(
-                    batch,
-                    self.optionset_name,
-                    self.language_code,
-                    entity_logical_name=self.entity,
-                    attribute_logical_name=self.attribute,
-                    continue_on_error=self.continue_on_error,
-                    progress_callback=cb,
-                )
-                if skipped:
-                    self.batch_log.emit(f"  ⚠ Skipped {len(skipped)} duplicate(s)")
-                return report  # may be None if all skipped
-            else:
-                return self.svc.bulk_insert_options(
-                    batch,
-                    self.optionset_name,
-                    self.language_code,
-                    entity_logical_name=self.entity,
-                    attribute_logical_name=self.attribute,
-                    continue_on_error=self.continue_on_error,
-                    progress_callback=cb,
-                )
-        elif self.operation == "update":
-            return self.svc.bulk_update_options(
-                batch,
-                self.optionset_name,
-                self.language_code,
+            return functools.partial(
+                self.svc.bulk_insert_options,
+                option_set_name=self.optionset_name,
+                language_code=self.language_code,
+                **common,
+            )
+        if self.operation == "update":
+            return functools.partial(
+                self.svc.bulk_update_options,
+                option_set_name=self.optionset_name,
+                language_code=self.language_code,
                 merge_labels=self.merge_labels,
-                entity_logical_name=self.entity,
-                attribute_logical_name=self.attribute,
-                continue_on_error=self.continue_on_error,
-                progress_callback=cb,
+                **common,
             )
-        elif self.operation == "delete":
-            return self.svc.bulk_delete_options(
-                batch,
-                self.optionset_name,
-                entity_logical_name=self.entity,
-                attribute_logical_name=self.attribute,
-                continue_on_error=self.continue_on_error,
-                progress_callback=cb,
+        if self.operation == "delete":
+            return functools.partial(
+                self.svc.bulk_delete_options,
+                option_set_name=self.optionset_name,
+                **common,
             )
         return None
+
+    def _run_batch(self, batch: list[OptionItem], cb: Any) -> BatchReport | None:
+        if self._call is None:
+            return None
+        return self._call(batch, progress_callback=cb)
@@ -1,22 +1,22 @@
 """
 MainWindow – glues the UI layout to the background workers.
 
-All Dataverse calls run in a QThread so the GUI never blocks.
+All Dataverse calls run on a shared QThreadPool so the GUI never blocks.
 """
 from __future__ import annotations
 
 import os
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QSettings, QThread, Qt
+from PySide6.QtCore import QModelIndex, QSettings, QSortFilterProxyModel, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
     QInputDialog,
     QMainWindow,
     QMessageBox,
-    QTableWidgetItem,
 )
 
 from OptionSetHelper import DataverseOptionSetService, OptionItem
@@ -32,13 +32,19 @@ from optionset_qt.controllers.main_controller import (
 )
 from optionset_qt.models.optionset_model import (
     OptionSetInfo,
-    extract_option_values,
-    extract_optionset_infos,
+    OptionValuesView,
+)
+from optionset_qt.models.table_models import (
+    OptionSetFilterProxy,
+    OptionSetTableModel,
+    OptionValueTableModel,
 )
 from optionset_qt.ui.main_window_ui import Ui_MainWindow
 from optionset_qt.views.bulk_progress_dialog import BulkProgressDialog
 from optionset_qt.views.settings_dialog import SettingsDialog
 
+FILTER_DEBOUNCE_MS = 150
+
 
 class MainWindow(QMainWindow):
     """Application main window."""
@@ -50,12 +56,31 @@ class MainWindow(QMainWindow):
         self.ui = Ui_MainWindow()
         self.ui.setup_ui(self)
 
+        # ── table models ────────────────────────────────────
+        self._os_model = OptionSetTableModel(self)
+        self._os_proxy = OptionSetFilterProxy(self)
+        self._os_proxy.setSourceModel(self._os_model)
+        self.ui.tbl_optionsets.setModel(self._os_proxy)
+        self._opt_model = OptionValueTableModel(self)
+        self._opt_proxy = QSortFilterProxyModel(self)  # sorting only
+        self._opt_proxy.setSourceModel(self._opt_model)
+        self.ui.tbl_options.setModel(self._opt_proxy)
+
         # ── state ───────────────────────────────────────────
         self._settings = QSettings("OptionSetHelper", "QtApp")
         self._svc: Optional[DataverseOptionSetService] = None
         self._optionset_infos: list[OptionSetInfo] = []
-        self._thread: Optional[QThread] = None  # current bg thread
+        self._shown_options: tuple[str, list] | None = None  # (name, raw list) on the right
         self._env_path: str = self._settings.value("env_path", "")
+        self._pool = QThreadPool.globalInstance()
+        self._pool.setMaxThreadCount(4)
+        self._workers: set = set()  # running workers (keeps them from being GC'd)
+
+        # live search: coalesce keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._filter_table)
 
         # ── wire signals ────────────────────────────────────
         self._connect_actions()
@@ -86,11 +111,14 @@ class MainWindow(QMainWindow):
         ui.action_bulk_delete.triggered.connect(lambda: self._bulk_op("delete"))
 
         # Tables
-        ui.tbl_optionsets.currentCellChanged.connect(self._on_optionset_selected)
+        ui.tbl_optionsets.selectionModel().currentRowChanged.connect(
+            self._on_optionset_selected
+        )
 
         # Search
         ui.btn_search.clicked.connect(self._filter_table)
         ui.search_input.returnPressed.connect(self._filter_table)
+        ui.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
 
     # ═══════════════════════════════════════════════════════════
     #  Helpers
@@ -99,6 +127,9 @@ class MainWindow(QMainWindow):
     def _log(self, msg: str) -> None:
         self.ui.log_output.append(msg)
 
+    def _log_error(self, msg: str) -> None:
+        self._log(f"❌ {msg}")
+
     def _status(self, msg: str) -> None:
         self.ui.lbl_status.setText(msg)
 
@@ -111,22 +142,26 @@ class MainWindow(QMainWindow):
         )
         return False
 
-    def _start_worker(self, worker, thread: QThread) -> None:
-        """Move *worker* to *thread*, start it, and keep a reference."""
-        # clean previous thread
-        if self._thread is not None and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(2000)
-        self._thread = thread
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        thread.start()
+    def _start(self, worker) -> None:
+        """Run *worker* on the pool, holding a reference until it finishes."""
+        self._workers.add(worker)
+        # connected last, so it runs after the caller's finished handlers
+        worker.signals.finished.connect(partial(self._release_worker, worker))
+        self._pool.start(worker)
+
+    def _release_worker(self, worker, _result: object = None) -> None:
+        self._workers.discard(worker)
+        worker.signals.deleteLater()
+
+    def _info_at(self, index: QModelIndex) -> OptionSetInfo | None:
+        """OptionSetInfo behind a (filtered) tbl_optionsets index."""
+        if not index.isValid():
+            return None
+        return self._os_model.info(self._os_proxy.mapToSource(index).row())
 
     def _ask_optionset_name(self, title: str = "OptionSet name") -> str | None:
-        row = self.ui.tbl_optionsets.currentRow()
-        default = ""
-        if row >= 0 and row < len(self._optionset_infos):
-            default = self._optionset_infos[row].name
+        info = self._info_at(self.ui.tbl_optionsets.currentIndex())
+        default = info.name if info else ""
         name, ok = QInputDialog.getText(self, title, "OptionSet name:", text=default)
         if ok and name.strip():
             return name.strip()
@@ -147,15 +182,11 @@ class MainWindow(QMainWindow):
 
     def _authenticate(self, env_path: str) -> None:
         self._status("Authenticating …")
-        thread = QThread(self)
         worker = AuthWorker(env_path)
-        worker.log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.finished.connect(self._on_auth_finished)
-        worker.finished.connect(thread.quit)
-        self._start_worker(worker, thread)
-        # prevent GC
-        self._auth_worker = worker
+        worker.signals.log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.finished.connect(self._on_auth_finished)
+        self._start(worker)
 
     def _on_auth_finished(self, svc: DataverseOptionSetService | None) -> None:
         self._svc = svc
@@ -173,88 +204,64 @@ class MainWindow(QMainWindow):
         if not self._ensure_connected():
             return
         self._status("Loading OptionSets …")
-        thread = QThread(self)
         worker = ListGlobalWorker(self._svc)
-        worker.log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.finished.connect(self._on_list_received)
-        worker.finished.connect(thread.quit)
-        self._start_worker(worker, thread)
-        self._list_worker = worker
-
-    def _on_list_received(self, raw_list: list) -> None:
-        self._optionset_infos = extract_optionset_infos(raw_list)
-        self._populate_optionsets_table(self._optionset_infos)
+        worker.signals.log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.finished.connect(self._on_list_received)
+        self._start(worker)
+
+    def _on_list_received(self, infos: list[OptionSetInfo]) -> None:
+        self._optionset_infos = infos
+        self._os_model.reset(self._optionset_infos)
         self._status(f"{len(self._optionset_infos)} OptionSets loaded")
 
-    def _populate_optionsets_table(self, infos: list[OptionSetInfo]) -> None:
-        tbl = self.ui.tbl_optionsets
-        tbl.setRowCount(0)
-        for info in infos:
-            r = tbl.rowCount()
-            tbl.insertRow(r)
-            tbl.setItem(r, 0, QTableWidgetItem(info.name))
-            tbl.setItem(r, 1, QTableWidgetItem(info.display_label))
-            tbl.setItem(r, 2, QTableWidgetItem(str(info.option_set_type)))
-            item = QTableWidgetItem()
-            item.setData(Qt.ItemDataRole.DisplayRole, info.option_count)
-            tbl.setItem(r, 3, item)
-
     def _filter_table(self) -> None:
-        text = self.ui.search_input.text().strip().lower()
-        if not text:
-            self._populate_optionsets_table(self._optionset_infos)
-            return
-        filtered = [
-            i for i in self._optionset_infos
-            if text in i.name.lower() or text in i.display_label.lower()
-        ]
-        self._populate_optionsets_table(filtered)
+        self._filter_timer.stop()
+        self._os_proxy.set_search_text(self.ui.search_input.text())
 
     # ═══════════════════════════════════════════════════════════
     #  Show options for selected OptionSet
     # ═══════════════════════════════════════════════════════════
 
-    def _on_optionset_selected(self, row: int, _col: int, _prev_row: int, _prev_col: int) -> None:
-        if row < 0 or row >= len(self._optionset_infos):
-            return
-        info = self._optionset_infos[row]
-        if info.name != self._optionset_infos[row].name:
+    def _on_optionset_selected(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        info = self._info_at(current)
+        if info is None:
             return
+        name = info.name
         # Use the raw data already fetched if available
-        raw_opts = info.raw.get("Options", [])
+        raw_opts = info.raw.get("Options")
         if raw_opts:
-            self._show_options(info.name, raw_opts)
+            self._show_options(name, raw_opts)
         else:
-            self._fetch_options_remote(info.name)
+            self._fetch_options_remote(name)
 
     def _fetch_options_remote(self, name: str) -> None:
         if not self._svc:
             return
         self._status(f"Loading options for '{name}' …")
-        thread = QThread(self)
         worker = FetchOptionsWorker(self._svc, name)
-        worker.log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.finished.connect(lambda opts: self._show_options(name, opts))
-        worker.finished.connect(thread.quit)
-        self._start_worker(worker, thread)
-        self._fetch_worker = worker
+        worker.signals.log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.finished.connect(partial(self._on_options_fetched, name))
+        self._start(worker)
+
+    def _on_options_fetched(self, name: str, raw_options: list) -> None:
+        # The selection may have moved on while the request was in flight
+        current = self._info_at(self.ui.tbl_optionsets.currentIndex())
+        if current is None or current.name != name:
+            return
+        self._show_options(name, raw_options)
 
     def _show_options(self, name: str, raw_options: list) -> None:
-        vals = extract_option_values(raw_options)
+        # Re-selecting the OptionSet already on screen (same fetched data)
+        # would rebuild an identical table
+        shown = self._shown_options
+        if shown is not None and shown[0] == name and shown[1] is raw_options:
+            return
+        self._shown_options = (name, raw_options)
+        vals = OptionValuesView(raw_options)
         self.ui.lbl_detail_title.setText(f"{name}  ({len(vals)} options)")
-        tbl = self.ui.tbl_options
-        tbl.setSortingEnabled(False)
-        tbl.setRowCount(0)
-        for v in vals:
-            r = tbl.rowCount()
-            tbl.insertRow(r)
-            item_val = QTableWidgetItem()
-            item_val.setData(Qt.ItemDataRole.DisplayRole, v.value)
-            tbl.setItem(r, 0, item_val)
-            tbl.setItem(r, 1, QTableWidgetItem(v.label))
-        tbl.setSortingEnabled(True)
+        self._opt_model.reset(vals)
         self._status(f"Showing {len(vals)} options for '{name}'")
 
     # ═══════════════════════════════════════════════════════════
@@ -287,16 +294,13 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "File error", str(exc))
             return
 
-        thread = QThread(self)
         worker = CreateGlobalWorker(self._svc, name, label, options)
-        worker.log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.finished.connect(lambda ok: self._on_create_finished(ok, name))
-        worker.finished.connect(thread.quit)
-        self._start_worker(worker, thread)
-        self._create_worker = worker
-
-    def _on_create_finished(self, success: bool, name: str) -> None:
+        worker.signals.log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.finished.connect(partial(self._on_create_finished, name=name))
+        self._start(worker)
+
+    def _on_create_finished(self, success: bool, *, name: str) -> None:
         if success:
             QMessageBox.information(self, "Success", f"OptionSet '{name}' created!")
             self._refresh_list()
@@ -321,16 +325,13 @@ class MainWindow(QMainWindow):
             return
         opt = OptionItem(label=label.strip(), value=val)
 
-        thread = QThread(self)
         worker = InsertSingleWorker(self._svc, opt, name)
-        worker.log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.finished.connect(lambda ok: self._on_insert_finished(ok, name))
-        worker.finished.connect(thread.quit)
-        self._start_worker(worker, thread)
-        self._insert_worker = worker
-
-    def _on_insert_finished(self, success: bool, name: str) -> None:
+        worker.signals.log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.finished.connect(partial(self._on_insert_finished, name=name))
+        self._start(worker)
+
+    def _on_insert_finished(self, success: bool, *, name: str) -> None:
         if success:
             self._log(f"✅ Option inserted into '{name}'")
             self._fetch_options_remote(name)  # refresh right panel
@@ -371,7 +372,6 @@ class MainWindow(QMainWindow):
         dlg = BulkProgressDialog(f"Bulk {operation.title()}", self)
         dlg.show()
 
-        thread = QThread(self)
         worker = BulkOperationWorker(
             self._svc,
             options,
@@ -379,24 +379,26 @@ class MainWindow(QMainWindow):
             operation,
             safe_insert=(operation == "insert"),
         )
-        worker.log.connect(self._log)
-        worker.log.connect(dlg.append_log)
-        worker.batch_log.connect(dlg.append_log)
-        worker.batch_log.connect(self._log)
-        worker.error.connect(lambda e: self._log(f"❌ {e}"))
-        worker.error.connect(dlg.append_log)
-        worker.progress.connect(dlg.set_batch_progress)
-        worker.finished.connect(lambda r: self._on_bulk_finished(r, operation, name, dlg))
-        worker.finished.connect(thread.quit)
-
-        dlg.cancel_requested.connect(thread.requestInterruption)
-
-        self._start_worker(worker, thread)
-        # prevent GC
-        self._bulk_worker = worker
+        worker.signals.log.connect(self._log)
+        worker.signals.log.connect(dlg.append_log)
+        worker.signals.batch_log.connect(dlg.append_log)
+        worker.signals.batch_log.connect(self._log)
+        worker.signals.error.connect(self._log_error)
+        worker.signals.error.connect(dlg.append_log)
+        worker.signals.progress.connect(dlg.set_batch_progress)
+        worker.signals.finished.connect(
+            partial(self._on_bulk_finished, operation=operation, name=name, dlg=dlg)
+        )
+
+        dlg.cancel_requested.connect(worker.cancel)
+
+        self._start(worker)
         self._bulk_dlg = dlg
 
-    def _on_bulk_finished(self, report, operation: str, name: str, dlg: BulkProgressDialog) -> None:
+    def _on_bulk_finished(
+        self, report, *, operation: str, name: str, dlg: BulkProgressDialog
+    ) -> None:
+        dlg.cancel_requested.disconnect()  # drop the dialog's hold on the worker
         if report is not None:
             summary = (
                 f"Bulk {operation} complete – "
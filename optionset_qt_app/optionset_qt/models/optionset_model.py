@@ -3,10 +3,19 @@ Data models and helpers shared across the application.
 """
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import IO, Iterable, Sequence
 
+try:  # optional incremental JSON parser
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class OptionSetInfo:
     """Lightweight representation of a global OptionSet (for the left table)."""
     name: str
@@ -16,46 +25,136 @@ class OptionSetInfo:
     raw: dict = field(default_factory=dict, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionValueInfo:
     """Lightweight representation of a single option (for the right table)."""
     value: int
     label: str
 
 
+_BY_NAME = attrgetter("name")
+_BY_VALUE = attrgetter("value")
+
+
+def _localized_label(label: dict | None, language_code: int) -> str:
+    """The ``language_code`` entry of a Dataverse Label's LocalizedLabels, or ""."""
+    if not label:
+        return ""
+    localized = label.get("LocalizedLabels")
+    if not localized:
+        return ""
+    # Single-language orgs (the usual case) list the wanted label first
+    first = localized[0]
+    if first.get("LanguageCode") == language_code:
+        return first["Label"]
+    try:
+        return next(
+            (loc["Label"] for loc in localized if loc["LanguageCode"] == language_code),
+            "",
+        )
+    except KeyError:  # hand-built entries may omit LanguageCode
+        return next(
+            (loc["Label"] for loc in localized if loc.get("LanguageCode") == language_code),
+            "",
+        )
+
+
+def _optionset_info(item: dict, language_code: int) -> OptionSetInfo:
+    return OptionSetInfo(
+        name=item.get("Name", ""),
+        display_label=_localized_label(item.get("DisplayName"), language_code),
+        # a handful of distinct values ("Picklist", "Boolean", …) shared by all
+        option_set_type=sys.intern(item.get("OptionSetType") or ""),
+        option_count=len(item.get("Options") or ()),
+        raw=item,
+    )
+
+
 def extract_optionset_infos(
-    raw_list: list[dict], language_code: int = 1033
+    raw_list: Iterable[dict], language_code: int = 1033
 ) -> list[OptionSetInfo]:
     """Convert the Dataverse JSON array into a list of OptionSetInfo."""
-    infos: list[OptionSetInfo] = []
-    for item in raw_list:
-        display = ""
-        for lbl in item.get("DisplayName", {}).get("LocalizedLabels", []):
-            if lbl.get("LanguageCode") == language_code:
-                display = lbl["Label"]
-                break
-        infos.append(
-            OptionSetInfo(
-                name=item.get("Name", ""),
-                display_label=display,
-                option_set_type=item.get("OptionSetType", ""),
-                option_count=len(item.get("Options", [])),
-                raw=item,
-            )
+    infos = [_optionset_info(item, language_code) for item in raw_list]
+    infos.sort(key=_BY_NAME)
+    return infos
+
+
+def extract_optionset_infos_from_stream(
+    fp: IO[bytes], language_code: int = 1033, prefix: str = "value.item"
+) -> list[OptionSetInfo]:
+    """
+    Like extract_optionset_infos, but reads the JSON document from *fp*.
+
+    *prefix* is the ijson path of the OptionSet array items (``value.item``
+    for a raw Dataverse response).  With ijson installed each OptionSet is
+    turned into an OptionSetInfo as soon as it is parsed.  Otherwise json's
+    ``object_hook`` does the same bottom-up: every dict carrying
+    ``OptionSetType`` is replaced by its OptionSetInfo (which keeps the dict
+    as ``raw``) the moment it is closed.
+    """
+    if ijson is not None:
+        return extract_optionset_infos(
+            ijson.items(fp, prefix, use_float=True), language_code
         )
-    return sorted(infos, key=lambda x: x.name)
+
+    def _hook(d: dict) -> dict | OptionSetInfo:
+        if "OptionSetType" in d:
+            return _optionset_info(d, language_code)
+        return d
+
+    doc = json.load(fp, object_hook=_hook)
+    for key in prefix.split(".")[:-1]:
+        doc = doc.get(key, [])
+    infos = [
+        i if isinstance(i, OptionSetInfo) else _optionset_info(i, language_code)
+        for i in doc
+    ]
+    infos.sort(key=_BY_NAME)
+    return infos
 
 
 def extract_option_values(
     options: list[dict], language_code: int = 1033
 ) -> list[OptionValueInfo]:
     """Convert raw option dicts into OptionValueInfo list."""
-    result: list[OptionValueInfo] = []
-    for opt in options:
-        lbl = ""
-        for loc in opt.get("Label", {}).get("LocalizedLabels", []):
-            if loc.get("LanguageCode") == language_code:
-                lbl = loc["Label"]
-                break
-        result.append(OptionValueInfo(value=opt.get("Value", 0), label=lbl))
-    return sorted(result, key=lambda x: x.value)
+    result = [
+        OptionValueInfo(
+            value=opt.get("Value", 0),
+            label=_localized_label(opt.get("Label"), language_code),
+        )
+        for opt in options
+    ]
+    result.sort(key=_BY_VALUE)
+    return result
+
+
+class OptionValuesView(Sequence[OptionValueInfo]):
+    """
+    Value-ordered OptionValueInfo sequence over raw option dicts.
+
+    Only the ordering is computed up front; each OptionValueInfo (and its
+    label lookup) is built the first time its row is read, so a table
+    showing a few dozen rows of a huge OptionSet builds a few dozen infos.
+    """
+
+    def __init__(self, options: list[dict], language_code: int = 1033) -> None:
+        values = [opt.get("Value", 0) for opt in options]
+        self._options = options
+        self._language_code = language_code
+        self._order = sorted(range(len(options)), key=values.__getitem__)
+        self._items: list[OptionValueInfo | None] = [None] * len(options)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            opt = self._options[self._order[index]]
+            item = self._items[index] = OptionValueInfo(
+                value=opt.get("Value", 0),
+                label=_localized_label(opt.get("Label"), self._language_code),
+            )
+        return item
@@ -0,0 +1,127 @@
+"""
+Qt item models for the two main-window tables.
+
+The models read straight from the OptionSetInfo / OptionValueInfo lists,
+so repopulating a table is a single model reset rather than one
+QTableWidgetItem per cell.
+"""
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+)
+
+from optionset_qt.models.optionset_model import OptionSetInfo, OptionValueInfo
+
+_DISPLAY = Qt.ItemDataRole.DisplayRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+
+
+class OptionSetTableModel(QAbstractTableModel):
+    """Name / Display Label / Type / # Options, one row per OptionSetInfo."""
+
+    HEADERS = ("Name", "Display Label", "Type", "# Options")
+
+    def __init__(self, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._infos: list[OptionSetInfo] = []
+        self._search_index: list[tuple[str, str]] = []  # lowercased (name, label)
+
+    def reset(self, infos: list[OptionSetInfo]) -> None:
+        self.beginResetModel()
+        self._infos = infos
+        self._search_index = [(i.name.lower(), i.display_label.lower()) for i in infos]
+        self.endResetModel()
+
+    def info(self, row: int) -> OptionSetInfo:
+        return self._infos[row]
+
+    def matches(self, row: int, text: str) -> bool:
+        """True if lowercased *text* occurs in the row's name or display label."""
+        name, label = self._search_index[row]
+        return text in name or text in label
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._infos)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY) -> Any:
+        if role != _DISPLAY or not index.isValid():
+            return None
+        info = self._infos[index.row()]
+        col = index.column()
+        if col == 0:
+            return info.name
+        if col == 1:
+            return info.display_label
+        if col == 2:
+            return str(info.option_set_type)
+        return info.option_count  # int, so the column sorts numerically
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY) -> Any:
+        if role == _DISPLAY and orientation == _HORIZONTAL:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class OptionSetFilterProxy(QSortFilterProxyModel):
+    """Filters an OptionSetTableModel by a case-insensitive substring."""
+
+    def __init__(self, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._text = ""
+
+    def set_search_text(self, text: str) -> None:
+        text = text.strip().lower()
+        if text == self._text:
+            return
+        if hasattr(self, "beginFilterChange"):  # Qt >= 6.10
+            self.beginFilterChange()
+            self._text = text
+            self.endFilterChange()
+        else:
+            self._text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return not self._text or self.sourceModel().matches(source_row, self._text)
+
+
+class OptionValueTableModel(QAbstractTableModel):
+    """Value / Label, one row per OptionValueInfo."""
+
+    HEADERS = ("Value", "Label")
+
+    def __init__(self, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._values: Sequence[OptionValueInfo] = []
+
+    def reset(self, values: Sequence[OptionValueInfo]) -> None:
+        """*values* may be a lazy OptionValuesView; rows are read on demand."""
+        self.beginResetModel()
+        self._values = values
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._values)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY) -> Any:
+        if role != _DISPLAY or not index.isValid():
+            return None
+        v = self._values[index.row()]
+        return v.value if index.column() == 0 else v.label
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY) -> Any:
+        if role == _DISPLAY and orientation == _HORIZONTAL:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
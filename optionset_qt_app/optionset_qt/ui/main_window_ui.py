@@ -19,8 +19,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSplitter,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolBar,
     QVBoxLayout,
@@ -106,10 +105,8 @@ class Ui_MainWindow:
         left_layout.addLayout(search_row)
 
         # OptionSets table
-        self.tbl_optionsets = QTableWidget(0, 4)
-        self.tbl_optionsets.setHorizontalHeaderLabels(
-            ["Name", "Display Label", "Type", "# Options"]
-        )
+        # (models are attached by MainWindow)
+        self.tbl_optionsets = QTableView()
         self.tbl_optionsets.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.ResizeMode.Stretch
         )
@@ -117,12 +114,16 @@ class Ui_MainWindow:
             1, QHeaderView.ResizeMode.Stretch
         )
         self.tbl_optionsets.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.tbl_optionsets.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QTableView.EditTrigger.NoEditTriggers
         )
         self.tbl_optionsets.setAlternatingRowColors(True)
+        # Fixed row heights: no per-row size hints on large catalogs
+        self.tbl_optionsets.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
         left_layout.addWidget(self.tbl_optionsets)
 
         splitter.addWidget(left_widget)
@@ -136,19 +137,21 @@ class Ui_MainWindow:
         self.lbl_detail_title.setStyleSheet("font-weight: bold; font-size: 14px;")
         right_layout.addWidget(self.lbl_detail_title)
 
-        self.tbl_options = QTableWidget(0, 2)
-        self.tbl_options.setHorizontalHeaderLabels(["Value", "Label"])
+        self.tbl_options = QTableView()
         self.tbl_options.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
         self.tbl_options.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
         )
         self.tbl_options.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
+            QTableView.EditTrigger.NoEditTriggers
         )
         self.tbl_options.setAlternatingRowColors(True)
         self.tbl_options.setSortingEnabled(True)
+        self.tbl_options.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
         right_layout.addWidget(self.tbl_options)
 
         splitter.addWidget(right_widget)
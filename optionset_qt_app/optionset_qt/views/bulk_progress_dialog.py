@@ -1,16 +1,19 @@
 """Bulk-operation progress dialog with log output and cancel."""
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QDialog,
     QLabel,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
 )
 
+LOG_FLUSH_MS = 100
+LOG_MAX_BLOCKS = 5000
+
 
 class BulkProgressDialog(QDialog):
     """
@@ -45,13 +48,21 @@ class BulkProgressDialog(QDialog):
         layout.addWidget(self.lbl_batch)
 
         # ── log area ────────────────────────────────────────
-        self.txt_log = QTextEdit()
+        self.txt_log = QPlainTextEdit()
         self.txt_log.setReadOnly(True)
+        self.txt_log.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.txt_log.setStyleSheet(
-            "QTextEdit { font-family: 'Cascadia Mono', 'Consolas', monospace; font-size: 12px; }"
+            "QPlainTextEdit { font-family: 'Cascadia Mono', 'Consolas', monospace; font-size: 12px; }"
         )
         layout.addWidget(self.txt_log, stretch=1)
 
+        # log lines are buffered and written at most every LOG_FLUSH_MS
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # ── buttons ─────────────────────────────────────────
         self.btn_close = QPushButton("Cancel")
         self.btn_close.clicked.connect(self._on_close)
@@ -70,16 +81,25 @@ class BulkProgressDialog(QDialog):
         self.lbl_batch.setText(f"Batch {current} / {total}")
 
     def append_log(self, text: str) -> None:
-        self.txt_log.append(text)
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
 
     def mark_finished(self, summary: str = "") -> None:
         self._finished = True
         self.btn_close.setText("Close")
         if summary:
-            self.txt_log.append(f"\n{summary}")
+            self._log_buf.append(f"\n{summary}")
+        self._flush_log()
         self.lbl_batch.setText("Done")
 
     # ── internal ────────────────────────────────────────────
+    def _flush_log(self) -> None:
+        self._log_timer.stop()
+        if self._log_buf:
+            self.txt_log.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
+
     def _on_close(self) -> None:
         if self._finished:
             self.accept()
@@ -1,9 +1,11 @@
 """Settings dialog – configure .env path and review connection info."""
 from __future__ import annotations
 
+import re
+import stat
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -17,6 +19,16 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+try:
+    from dotenv import dotenv_values
+except ImportError:  # pragma: no cover
+    dotenv_values = None  # type: ignore[assignment]
+
+PREVIEW_DEBOUNCE_MS = 200
+
+# KEY = value per line; blank lines, comments and lines without "=" don't match
+_ENV_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
 
 class SettingsDialog(QDialog):
     """Modal dialog to select a .env file and preview the settings."""
@@ -27,6 +39,14 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(520)
 
         self._env_path = current_env_path
+        # (path, mtime_ns) -> parsed values, so retyping a path doesn't re-read it
+        self._parse_cache: dict[tuple[str, int], dict[str, str]] = {}
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(
+            lambda: self._load_preview(self.txt_env_path.text())
+        )
 
         layout = QVBoxLayout(self)
 
@@ -82,7 +102,7 @@ class SettingsDialog(QDialog):
         if current_env_path:
             self._load_preview(current_env_path)
 
-        self.txt_env_path.textChanged.connect(self._load_preview)
+        self.txt_env_path.textChanged.connect(lambda _text: self._preview_timer.start())
 
     # ── helpers ─────────────────────────────────────────────
     def _browse_env(self) -> None:
@@ -93,13 +113,21 @@ class SettingsDialog(QDialog):
             self.txt_env_path.setText(path)
 
     def _load_preview(self, path: str) -> None:
+        self._preview_timer.stop()
         p = Path(path)
-        if not p.is_file():
+        try:
+            st = p.stat()
+        except (OSError, ValueError):
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             self.lbl_status.setText("⚠ File not found")
             self._clear_preview()
             return
         try:
-            data = self._parse_env(p)
+            key = (str(p), st.st_mtime_ns)
+            data = self._parse_cache.get(key)
+            if data is None:
+                data = self._parse_cache[key] = self._read_env(p)
             self.lbl_env_url.setText(data.get("environmentUrl", ""))
             self.lbl_tenant.setText(data.get("tenant_id", ""))
             self.lbl_client.setText(data.get("client_id", ""))
@@ -113,18 +141,19 @@ class SettingsDialog(QDialog):
         for w in (self.lbl_env_url, self.lbl_tenant, self.lbl_client, self.lbl_secret):
             w.clear()
 
+    @classmethod
+    def _read_env(cls, path: Path) -> dict[str, str]:
+        if dotenv_values is None:
+            return cls._parse_env(path)
+        return {
+            k: v or ""
+            for k, v in dotenv_values(path, encoding="utf-8-sig").items()
+        }
+
     @staticmethod
     def _parse_env(path: Path) -> dict[str, str]:
-        result: dict[str, str] = {}
-        for line in path.read_text(encoding="utf-8-sig").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            result[key.strip()] = value.strip().strip("\"'")
-        return result
+        text = path.read_text(encoding="utf-8-sig")
+        return {key: value.strip("\"'") for key, value in _ENV_RE.findall(text)}
 
     # ── public API ──────────────────────────────────────────
     def env_path(self) -> str:
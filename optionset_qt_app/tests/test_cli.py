@@ -0,0 +1,229 @@
+"""Tests for the command-line front-end helpers (no network access)."""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import cli
+from OptionSetHelper import BatchReport, BatchResult, OptionItem
+from optionset_qt.controllers.main_controller import load_options_from_file
+
+
+def _report_for(batch, *, fail_every: int = 1) -> BatchReport:
+    """A BatchReport in which every ``fail_every``-th option failed."""
+    results = [
+        BatchResult(i, o.label, o.value, 400 if i % fail_every == 0 else 204,
+                    i % fail_every != 0)
+        for i, o in enumerate(batch)
+    ]
+    failed = sum(not r.success for r in results)
+    return BatchReport(len(batch), len(batch) - failed, failed, results)
+
+
+def _options(n: int) -> list[OptionItem]:
+    return [OptionItem(f"L{i}", 1000 + i) for i in range(n)]
+
+
+class TestCsvLoader(unittest.TestCase):
+    """Tests for the CLI CSV loader (kept in line with the Qt loader)."""
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+
+    def _load(self, text: str) -> list[tuple[str, int]]:
+        path = self.tmp / "options.csv"
+        path.write_text(text, encoding="utf-8")
+        return [(o.label, o.value) for o in cli.load_options(str(path), use_cache=False)]
+
+    def _load_gui(self) -> list[tuple[str, int]]:
+        return [(o.label, o.value) for o in load_options_from_file(str(self.tmp / "options.csv"))]
+
+    def test_semicolon_delimited(self):
+        self.assertEqual(
+            self._load("label;value\nAlpha;100\nBeta;200\n"),
+            [("Alpha", 100), ("Beta", 200)],
+        )
+        self.assertEqual(self._load_gui(), [("Alpha", 100), ("Beta", 200)])
+
+    def test_single_column_header_skipped(self):
+        self.assertEqual(self._load("label\nAlpha\nBeta\n"), [("Alpha", 0), ("Beta", 1)])
+
+    def test_single_column_quoted_delimiter(self):
+        text = '"Smith, John"\n"Doe, Jane"\n'
+        expected = [("Smith, John", 0), ("Doe, Jane", 1)]
+        self.assertEqual(self._load(text), expected)
+        self.assertEqual(self._load_gui(), expected)
+        self.assertEqual(
+            self._load('label\n"Smith, John"\nAlpha\n'),
+            [("Smith, John", 0), ("Alpha", 1)],
+        )
+
+    def test_single_column_unquoted_delimiter(self):
+        # A delimiter the sniffer did not pick stays part of the label
+        text = "Alpha\nOps; EMEA\nBeta\n"
+        expected = [("Alpha", 0), ("Ops; EMEA", 1), ("Beta", 2)]
+        self.assertEqual(self._load(text), expected)
+        self.assertEqual(self._load_gui(), expected)
+        # The sniffed one splits the row, which then has no integer value
+        self.assertEqual(self._load("Alpha\nOps, EMEA\nBeta\n"), [("Alpha", 0), ("Beta", 1)])
+        self.assertEqual(self._load_gui(), [("Alpha", 0), ("Beta", 1)])
+
+
+class TestCaches(unittest.TestCase):
+    """Tests for the on-disk metadata and parsed-file caches."""
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+        self.cache_dir = self.tmp / "cache"
+        for name, value in (
+            ("CACHE_DIR", self.cache_dir),
+            ("PARSE_CACHE_DIR", self.cache_dir / "parsed"),
+        ):
+            patcher = patch.object(cli, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.source = self.tmp / "data" / "options.csv"
+        self.source.parent.mkdir()
+
+    def _load(self, **kwargs) -> list[tuple[str, int]]:
+        return [(o.label, o.value) for o in cli.load_options(str(self.source), **kwargs)]
+
+    @unittest.skipUnless(pyarrow, "pyarrow not installed")
+    def test_parse_cache_round_trip(self):
+        self.source.write_text("label,value\nAlpha,100\nBeta,200\n", encoding="utf-8")
+        self.assertEqual(self._load(), [("Alpha", 100), ("Beta", 200)])
+        cached = list((self.cache_dir / "parsed").glob("*.parquet"))
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(os.listdir(self.source.parent), ["options.csv"])
+
+        # Served from the cache without parsing the CSV again
+        with patch.object(cli, "_iter_options_from_csv", side_effect=AssertionError):
+            self.assertEqual(self._load(), [("Alpha", 100), ("Beta", 200)])
+
+    @unittest.skipUnless(pyarrow, "pyarrow not installed")
+    def test_parse_cache_invalidated_by_changes(self):
+        self.source.write_text("label,value\nAlpha,100\n", encoding="utf-8")
+        self._load()
+        self.source.write_text("label,value\nAlpha,100\nBeta,200\n", encoding="utf-8")
+        self.assertEqual(self._load(), [("Alpha", 100), ("Beta", 200)])
+
+        # Same size, newer mtime
+        self.source.write_text("label,value\nAlpha,100\nGamma,300\n", encoding="utf-8")
+        st = self.source.stat()
+        os.utime(self.source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self._load(), [("Alpha", 100), ("Gamma", 300)])
+        self.assertEqual(len(list((self.cache_dir / "parsed").glob("*.parquet"))), 1)
+
+    def test_parse_cache_opt_out(self):
+        self.source.write_text("label,value\nAlpha,100\n", encoding="utf-8")
+        self.assertEqual(self._load(use_cache=False), [("Alpha", 100)])
+        self.assertFalse((self.cache_dir / "parsed").exists())
+
+    def test_metadata_cache_and_clear(self):
+        svc = argparse.Namespace(environment_url="https://org.example.com")
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            return {"n": len(fetches)}
+
+        args = argparse.Namespace(no_cache=False)
+        self.assertEqual(cli._cached(svc, args, "k", fetch), {"n": 1})
+        self.assertEqual(cli._cached(svc, args, "k", fetch), {"n": 1})
+        self.assertEqual(cli._cached(svc, argparse.Namespace(no_cache=True), "k", fetch), {"n": 2})
+
+        parsed = self.cache_dir / "parsed"
+        parsed.mkdir()
+        (parsed / "x.parquet").write_bytes(b"")
+        self.assertEqual(cli._clear_cache(), 1)
+        self.assertTrue((parsed / "x.parquet").exists())
+        self.assertEqual(cli._clear_cache(parsed=True), 1)
+
+
+class TestRunBatches(unittest.TestCase):
+    """Tests for the _run_batches producer / consumer pipeline."""
+
+    def _run(self, options, run_batch, **kwargs):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+            report, codes = cli._run_batches(
+                options, run_batch, desc="test", max_workers=4, **kwargs
+            )
+        return report, codes, out.getvalue()
+
+    def test_jsonl_streams_every_result(self):
+        n = 1232  # more failures than FAILED_TAIL
+        report, codes, out = self._run(_options(n), _report_for, jsonl=True)
+        records = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(len(records), n)
+        self.assertEqual(sorted(r["idx"] for r in records), list(range(n)))
+        self.assertTrue(all(r["value"] == 1000 + r["idx"] for r in records))
+        self.assertEqual(report.failed, n)
+        self.assertEqual(len(report.results), cli.FAILED_TAIL)
+        self.assertEqual(codes, {400: n})
+
+    def test_lazy_input_offsets_and_report_out(self):
+        n = cli.BATCH_SIZE * 3 + 7
+        out_csv = Path(tempfile.mkdtemp()) / "report.csv"
+        self.addCleanup(out_csv.unlink, missing_ok=True)
+
+        def run_batch(batch):
+            return _report_for(batch, fail_every=10)
+
+        report, codes, _ = self._run(
+            iter(_options(n)), run_batch, report_out=str(out_csv), keep_all=True
+        )
+        self.assertEqual(report.total, n)
+        self.assertEqual([r.index for r in report.results], list(range(n)))
+        self.assertTrue(all(r.value == 1000 + r.index for r in report.results))
+        per_batch = [-(-len(b) // 10) for b in cli._batched(range(n), cli.BATCH_SIZE)]
+        self.assertEqual(report.failed, sum(per_batch))
+        self.assertEqual(codes[400] + codes[204], n)
+        with out_csv.open(encoding="utf-8") as fh:
+            self.assertEqual(len(fh.readlines()), n + 1)
+
+    def test_failed_batch_is_reraised(self):
+        calls = []
+
+        def run_batch(batch):
+            calls.append(batch[0].value)
+            if batch[0].value == 1000 + cli.BATCH_SIZE:
+                raise RuntimeError("HTTP 500")
+            time.sleep(0.01)
+            return _report_for(batch)
+
+        with self.assertRaisesRegex(RuntimeError, "HTTP 500"):
+            self._run(_options(cli.BATCH_SIZE * 40), run_batch)
+        self.assertLess(len(calls), 40)  # the remaining batches were skipped
+
+    def test_reader_error_is_reraised(self):
+        def options():
+            yield from _options(cli.BATCH_SIZE + 1)
+            raise ValueError("bad row")
+
+        with self.assertRaisesRegex(ValueError, "bad row"):
+            self._run(options(), _report_for)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 """Basic smoke tests for the OptionSet Qt application."""
 from __future__ import annotations
 
+import io
+import json
 import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -13,11 +16,24 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 from optionset_qt.models.optionset_model import (
     OptionSetInfo,
     OptionValueInfo,
+    OptionValuesView,
     extract_option_values,
     extract_optionset_infos,
+    extract_optionset_infos_from_stream,
 )
+from optionset_qt.models.table_models import (
+    OptionSetFilterProxy,
+    OptionSetTableModel,
+    OptionValueTableModel,
+)
+from optionset_qt.controllers import main_controller
 from optionset_qt.controllers.main_controller import load_options_from_file
 
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
 
 class TestModels(unittest.TestCase):
     """Tests for data model helpers."""
@@ -44,6 +60,22 @@ class TestModels(unittest.TestCase):
         self.assertEqual(result[0].display_label, "Test OS")
         self.assertEqual(result[0].option_count, 2)
 
+    def test_extract_optionset_infos_from_stream(self):
+        body = (
+            b'{"value": ['
+            b'{"Name": "b_os", "MetadataId": "id-b", "OptionSetType": "Picklist", '
+            b'"DisplayName": {"LocalizedLabels": '
+            b'[{"LanguageCode": 1033, "Label": "B"}]}, "Options": [{"Value": 1}]},'
+            b'{"Name": "a_os", "DisplayName": {"LocalizedLabels": []}}'
+            b']}'
+        )
+        result = extract_optionset_infos_from_stream(io.BytesIO(body))
+        self.assertEqual([i.name for i in result], ["a_os", "b_os"])
+        self.assertEqual(result[1].display_label, "B")
+        self.assertEqual(result[1].option_count, 1)
+        self.assertEqual(result[1].option_set_type, "Picklist")
+        self.assertEqual(result[1].raw["Options"], [{"Value": 1}])
+
     def test_extract_option_values(self):
         raw = [
             {
@@ -70,50 +102,156 @@ class TestModels(unittest.TestCase):
         result = extract_option_values(raw, language_code=1033)
         self.assertEqual(result[0].label, "")
 
+    def test_option_values_view(self):
+        raw = [
+            {"Value": v, "Label": {"LocalizedLabels": [{"LanguageCode": 1033, "Label": f"L{v}"}]}}
+            for v in (30, 10, 20)
+        ]
+        view = OptionValuesView(raw)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view[0], OptionValueInfo(10, "L10"))
+        self.assertEqual(view._items.count(None), 2)  # other rows not built yet
+        self.assertEqual(list(view), extract_option_values(raw))
+        self.assertEqual(view[-1:], [OptionValueInfo(30, "L30")])
+
     def test_optionset_info_dataclass(self):
         info = OptionSetInfo("n", "l", "Picklist", 3)
         self.assertEqual(info.name, "n")
         self.assertEqual(info.raw, {})
 
 
+class TestTableModels(unittest.TestCase):
+    """Tests for the Qt table models."""
+
+    def _infos(self):
+        return [
+            OptionSetInfo("alpha_os", "Phone Prefix", "Picklist", 3),
+            OptionSetInfo("beta_os", "Country", "Picklist", 12),
+        ]
+
+    def test_optionset_model_data(self):
+        model = OptionSetTableModel()
+        model.reset(self._infos())
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.columnCount(), 4)
+        self.assertEqual(model.index(0, 1).data(), "Phone Prefix")
+        self.assertEqual(model.index(1, 3).data(), 12)
+
+    def test_filter_proxy(self):
+        model = OptionSetTableModel()
+        model.reset(self._infos())
+        proxy = OptionSetFilterProxy()
+        proxy.setSourceModel(model)
+        proxy.set_search_text("  PHONE ")
+        self.assertEqual(proxy.rowCount(), 1)
+        self.assertEqual(proxy.index(0, 0).data(), "alpha_os")
+        proxy.set_search_text("")
+        self.assertEqual(proxy.rowCount(), 2)
+
+    def test_option_value_model(self):
+        model = OptionValueTableModel()
+        model.reset([OptionValueInfo(100, "Alpha")])
+        self.assertEqual(model.index(0, 0).data(), 100)
+        self.assertEqual(model.index(0, 1).data(), "Alpha")
+
+
 class TestFileLoader(unittest.TestCase):
     """Tests for CSV / JSON option loader."""
 
-    def test_load_csv(self, tmp_path=None):
-        import tempfile, os
-        fd, path = tempfile.mkstemp(suffix=".csv")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write("label,value\nAlpha,100\nBeta,200\n")
-            items = load_options_from_file(path)
-            self.assertEqual(len(items), 2)
-            self.assertEqual(items[0].label, "Alpha")
-            self.assertEqual(items[0].value, 100)
-        finally:
-            os.unlink(path)
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+
+    def test_load_csv(self):
+        path = self.tmp / "options.csv"
+        path.write_text("label,value\nAlpha,100\nBeta,200\n", encoding="utf-8")
+        items = load_options_from_file(str(path))
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0].label, "Alpha")
+        self.assertEqual(items[0].value, 100)
+
+    def test_load_large_csv(self):
+        from optionset_qt.controllers.main_controller import MMAP_THRESHOLD
+        path = self.tmp / "large.csv"
+        with path.open("w", encoding="utf-8") as f:
+            f.write("code,label,value\n")
+            n = 0
+            while f.tell() <= MMAP_THRESHOLD:
+                f.write(f"c{n},Ärger {n} ,{100000 + n}\n")
+                n += 1
+        items = load_options_from_file(str(path))
+        self.assertEqual(len(items), n)
+        self.assertEqual(items[0].label, "Ärger 0")
+        self.assertEqual(items[-1].value, 100000 + n - 1)
 
     def test_load_json_list(self):
-        import tempfile, os, json
-        fd, path = tempfile.mkstemp(suffix=".json")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump([{"label": "X", "value": 1}], f)
-            items = load_options_from_file(path)
-            self.assertEqual(len(items), 1)
-            self.assertEqual(items[0].label, "X")
-        finally:
-            os.unlink(path)
+        path = self.tmp / "options.json"
+        path.write_text(json.dumps([{"label": "X", "value": 1}]), encoding="utf-8")
+        items = load_options_from_file(str(path))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0].label, "X")
 
     def test_load_json_dict(self):
-        import tempfile, os, json
-        fd, path = tempfile.mkstemp(suffix=".json")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump({"Foo": 10, "Bar": 20}, f)
-            items = load_options_from_file(path)
-            self.assertEqual(len(items), 2)
-        finally:
-            os.unlink(path)
+        path = self.tmp / "options.json"
+        path.write_text(json.dumps({"Foo": 10, "Bar": 20}), encoding="utf-8")
+        items = load_options_from_file(str(path))
+        self.assertEqual(len(items), 2)
+
+
+@unittest.skipUnless(numba, "numba not installed")
+class TestRowScanner(unittest.TestCase):
+    """The compiled byte scanner must give the same options as csv.reader."""
+
+    UNQUOTED = {
+        "header": "label,value\nAlpha,100\n Beta , -200 \n\nGamma,x\n",
+        "three_columns": "code,label,value\nc1,Ärger ,10\n5,Five,xx\nc3,Three\n",
+        "single_column": "Alpha\nBeta\n\nGamma\n",
+        "crlf": "label,value\r\nÄ,1\r\nB,2\r\n",
+        "no_header": "Alpha,1\nBeta,2,extra\nGamma\n",
+        "long_int": "A,1234567890123456789012\nB,+7\nC,1_000\n",
+    }
+    QUOTED = {
+        "quoted": 'label,value\n"Smith, John",1\nDoe,2\n',
+        "embedded_newline": 'label,value\n"Multi\nline",1\nB,2\n',
+    }
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "options.csv"
+
+    def _load(self, text: str, *, mapped: bool) -> tuple[list, list[bool]]:
+        self.path.write_bytes(text.encode("utf-8"))
+        scanned: list[bool] = []
+        real_scan = main_controller._scan_mapped_rows
+
+        def scan(*args):
+            scanned.append(real_scan(*args))
+            return scanned[-1]
+
+        threshold = -1 if mapped else 1 << 40
+        with patch.object(main_controller, "MMAP_THRESHOLD", threshold), \
+                patch.object(main_controller, "_scan_mapped_rows", side_effect=scan):
+            items = load_options_from_file(str(self.path))
+        return [(o.label, o.value) for o in items], scanned
+
+    def test_unquoted_matches_csv_reader(self):
+        for name, text in self.UNQUOTED.items():
+            with self.subTest(name):
+                expected, _ = self._load(text, mapped=False)
+                items, scanned = self._load(text, mapped=True)
+                self.assertEqual(scanned, [True])
+                self.assertEqual(items, expected)
+
+    def test_quoted_falls_back_to_csv_reader(self):
+        for name, text in self.QUOTED.items():
+            with self.subTest(name):
+                expected, _ = self._load(text, mapped=False)
+                items, scanned = self._load(text, mapped=True)
+                self.assertEqual(scanned, [])
+                self.assertEqual(items, expected)
+        self.assertEqual(expected, [("Multi\nline", 1), ("B", 2)])
 
 
 if __name__ == "__main__":
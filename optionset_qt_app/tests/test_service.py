@@ -0,0 +1,399 @@
+"""Tests for the Dataverse service layer (HTTP calls are mocked)."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from OptionSetHelper import DataverseOptionSetService, OptionItem, _retry_after_seconds
+
+
+def _response(status_code: int = 200, content: bytes = b"{}", headers=None):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = content
+    resp.headers.update(headers or {})
+    resp.url = "https://org.example.com/api/data/v9.2/$batch"
+    return resp
+
+
+def _token_response():
+    return _response(content=b'{"access_token": "tok", "expires_in": 3600}')
+
+
+def _batch_body(*codes: int) -> bytes:
+    """A $batch response body with one sub-response per status code."""
+    return b"".join(
+        b"--changesetresponse\r\nContent-Type: application/http\r\n\r\n"
+        b"HTTP/1.1 %d Status\r\n\r\n" % code
+        for code in codes
+    )
+
+
+def _options(n: int) -> list[OptionItem]:
+    return [OptionItem(f"L{i}", 1000 + i) for i in range(n)]
+
+
+class _FakeAioResponse:
+    def __init__(self, status: int, content: bytes, headers=None):
+        self.status = status
+        self._content = content
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self) -> bytes:
+        return self._content
+
+
+class _FakeAioSession:
+    """Minimal ``aiohttp.ClientSession`` stand-in driven by a handler."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def post(self, url, *, headers, data):
+        self.calls.append(headers)
+        return _AwaitingResponse(self.handler, headers, data)
+
+
+class _AwaitingResponse:
+    def __init__(self, handler, headers, data):
+        self._call = (handler, headers, data)
+
+    async def __aenter__(self):
+        handler, headers, data = self._call
+        return await handler(headers, data)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class ServiceTestCase(unittest.TestCase):
+    """Builds a service whose token endpoint is mocked."""
+
+    def setUp(self):
+        DataverseOptionSetService._TOKEN_CACHE.clear()
+        self.addCleanup(DataverseOptionSetService._TOKEN_CACHE.clear)
+        self.svc = DataverseOptionSetService(
+            "https://org.example.com", "tenant", "client", "secret"
+        )
+        self.addCleanup(self.svc.close)
+        self.svc._set_token("tok", 2**40)
+
+
+class TestHeaders(ServiceTestCase):
+
+    def test_headers_survive_concurrent_invalidation(self):
+        real = self.svc.get_bearer_token
+
+        def get_token(**kwargs):
+            token = real(**kwargs)
+            self.svc._invalidate_token()  # another chunk got a 401 meanwhile
+            return token
+
+        with patch.object(self.svc, "_send", return_value=_token_response()), \
+                patch.object(self.svc, "get_bearer_token", side_effect=get_token):
+            headers = self.svc._headers()
+            batch = self.svc._batch_headers("batch_x", continue_on_error=True)
+        self.assertEqual(headers["Authorization"], "Bearer tok")
+        self.assertEqual(headers["OData-Version"], "4.0")
+        self.assertEqual(batch["Content-Type"], "multipart/mixed;boundary=batch_x")
+        self.assertEqual(batch["Prefer"], "odata.continue-on-error")
+
+    def test_headers_threads_racing_invalidate(self):
+        errors = []
+        stop = threading.Event()
+
+        def invalidate():
+            while not stop.is_set():
+                self.svc._invalidate_token()
+
+        def build():
+            try:
+                for _ in range(2000):
+                    headers = self.svc._batch_headers("b", continue_on_error=False)
+                    assert headers["Authorization"] == "Bearer tok"
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        with patch.object(self.svc, "_send", return_value=_token_response()):
+            invalidator = threading.Thread(target=invalidate)
+            invalidator.start()
+            builders = [threading.Thread(target=build) for _ in range(4)]
+            for t in builders:
+                t.start()
+            for t in builders:
+                t.join()
+            stop.set()
+            invalidator.join()
+        self.assertEqual(errors, [])
+
+
+class TestLabelIndex(ServiceTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.lists = 0
+        self.label = "Phone Prefix"
+        self.on_list = None
+        patcher = patch.object(self.svc, "list_global_optionsets", side_effect=self._list)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _list(self):
+        self.lists += 1
+        if self.on_list:
+            self.on_list()
+        return [
+            {
+                "Name": "os",
+                "DisplayName": {"LocalizedLabels": [{"LanguageCode": 1033, "Label": self.label}]},
+            }
+        ]
+
+    def _search(self, text):
+        return [d["Name"] for d in self.svc.search_global_optionsets_by_label(text)]
+
+    def test_index_reused_until_invalidated(self):
+        self.assertEqual(self._search("PHONE"), ["os"])
+        self.assertEqual(self._search("prefix"), ["os"])
+        self.assertEqual(self.lists, 1)
+
+        self.label = "Country"
+        self.svc.invalidate_optionset_cache("os")
+        self.assertEqual(self._search("phone"), [])
+        self.assertEqual(self._search("country"), ["os"])
+        self.assertEqual(self.lists, 2)
+
+    def test_invalidation_during_build_is_not_overwritten(self):
+        self.on_list = self.svc.invalidate_optionset_cache
+        self.assertEqual(self._search("phone"), ["os"])
+        self.on_list = None
+        self._search("phone")
+        self.assertEqual(self.lists, 2)  # the stale index was not kept
+
+
+class TestBatchResponse(unittest.TestCase):
+
+    def test_parse_statuses_in_order(self):
+        body = _batch_body(204, 400, 204) + b"HTTP/1.1 500 Extra\r\n"
+        report = DataverseOptionSetService._parse_batch_response(body, _options(3))
+        self.assertEqual((report.total, report.succeeded, report.failed), (3, 2, 2))
+        self.assertEqual([r.status_code for r in report.results], [204, 400, 204, 500])
+        self.assertEqual(report.results[1].label, "L1")
+        self.assertEqual(report.results[3].label, "?")  # more sub-responses than options
+
+    def test_parse_unrecognised_body_is_optimistic(self):
+        report = DataverseOptionSetService._parse_batch_response(b"garbage", _options(2))
+        self.assertEqual((report.succeeded, report.failed, report.results), (2, 0, []))
+
+    def test_retry_after_seconds(self):
+        self.assertEqual(_retry_after_seconds("3"), 3.0)
+        self.assertEqual(_retry_after_seconds(None), 1.0)
+        self.assertEqual(_retry_after_seconds("soon", default=2.0), 2.0)
+        self.assertEqual(_retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+class TestBulk(ServiceTestCase):
+    """Tests for the threaded $batch path with a mocked transport."""
+
+    def setUp(self):
+        super().setUp()
+        self.posts: list[tuple[dict, bytes]] = []
+        self.batch_responses: list = []  # consumed in order; default: all 204
+        self.token_calls = 0
+        send = patch.object(self.svc, "_send", side_effect=self._send)
+        send.start()
+        self.addCleanup(send.stop)
+
+    def _send(self, method, url, **kwargs):
+        if "login.microsoftonline.com" in url:
+            self.token_calls += 1
+            return _token_response()
+        data = kwargs["data"]
+        self.posts.append((kwargs["headers"], data))
+        if self.batch_responses:
+            return self.batch_responses.pop(0)
+        codes = [400 if b'"L3"' in part else 204 for part in data.split(b"Content-ID: ")[1:]]
+        return _response(200, _batch_body(*codes))
+
+    def test_chunks_merged_in_input_order(self):
+        report = self.svc.bulk_insert_options(
+            _options(5), "os", chunk_size=2, max_workers=3, continue_on_error=True
+        )
+        self.assertEqual(len(self.posts), 3)
+        self.assertEqual((report.total, report.succeeded, report.failed), (5, 4, 1))
+        self.assertEqual([r.index for r in report.results], [0, 1, 2, 3, 4])
+        self.assertEqual([r.value for r in report.results], [1000, 1001, 1002, 1003, 1004])
+        self.assertFalse(report.results[3].success)
+        self.assertTrue(all(h["Prefer"] == "odata.continue-on-error" for h, _ in self.posts))
+
+    def test_single_chunk_is_not_split(self):
+        report = self.svc.bulk_insert_options(_options(3), "os", chunk_size=3)
+        self.assertEqual(len(self.posts), 1)
+        self.assertEqual(self.posts[0][1].count(b"Content-ID: "), 3)
+        self.assertEqual(report.total, 3)
+
+    def test_failing_chunk_raises(self):
+        self.batch_responses = [_response(500, b"boom")]
+        self.svc._optionset_cache[("os", None, None)] = (0.0, [])
+        with self.assertRaises(requests.HTTPError):
+            self.svc.bulk_insert_options(_options(4), "os", chunk_size=2, max_workers=1)
+        self.assertEqual(len(self.posts), 1)  # later chunks are not sent
+        self.assertEqual(self.svc._optionset_cache, {})  # still invalidated
+
+    def test_throttled_batch_honours_retry_after(self):
+        self.batch_responses = [_response(429, b"", {"Retry-After": "2"})]
+        with patch("OptionSetHelper.time.sleep") as sleep:
+            report = self.svc.bulk_insert_options(_options(2), "os")
+        self.assertEqual(report.succeeded, 2)
+        self.assertEqual(len(self.posts), 2)
+        sleep.assert_called_once()
+        self.assertTrue(2.0 <= sleep.call_args[0][0] <= 2.5)
+
+    def test_throttled_batch_gives_up(self):
+        self.batch_responses = [
+            _response(503, b"") for _ in range(DataverseOptionSetService.MAX_BATCH_ATTEMPTS)
+        ]
+        with patch("OptionSetHelper.time.sleep"), self.assertRaises(requests.HTTPError):
+            self.svc.bulk_insert_options(_options(2), "os")
+        self.assertEqual(len(self.posts), DataverseOptionSetService.MAX_BATCH_ATTEMPTS)
+
+    def test_401_refreshes_token_once(self):
+        self.svc._set_token("stale", 2**40)
+        self.batch_responses = [_response(401, b"")]
+        report = self.svc.bulk_insert_options(_options(2), "os")
+        self.assertEqual(report.succeeded, 2)
+        self.assertEqual(self.token_calls, 1)
+        self.assertEqual(
+            [h["Authorization"] for h, _ in self.posts], ["Bearer stale", "Bearer tok"]
+        )
+
+
+class TestAsyncBulk(ServiceTestCase):
+    """Tests for the aiohttp bulk path with a fake session."""
+
+    def _run(self, session, options, **kwargs):
+        kwargs.setdefault("chunk_size", 2)
+        return asyncio.run(
+            self.svc.abulk_insert_options(options, "os", session=session, **kwargs)
+        )
+
+    def test_chunks_merged_with_offsets(self):
+        async def handler(headers, data):
+            n = data.count(b"Content-ID: ")
+            codes = [400 if b'"L3"' in data and i == 1 else 204 for i in range(n)]
+            return _FakeAioResponse(200, _batch_body(*codes))
+
+        report = self._run(_FakeAioSession(handler), _options(5), continue_on_error=True)
+        self.assertEqual((report.total, report.succeeded, report.failed), (5, 4, 1))
+        self.assertEqual([r.index for r in report.results], [0, 1, 2, 3, 4])
+        self.assertEqual([r.value for r in report.results], [1000, 1001, 1002, 1003, 1004])
+        self.assertFalse(report.results[3].success)
+
+    def test_failing_chunk_cancels_siblings(self):
+        cancelled = []
+
+        async def handler(headers, data):
+            if b'"L0"' in data:
+                return _FakeAioResponse(500, b"boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(data)
+                raise
+            return _FakeAioResponse(200, _batch_body(204, 204))
+
+        async def main():
+            with self.assertRaises(RuntimeError):
+                await self.svc.abulk_insert_options(
+                    _options(6), "os", session=_FakeAioSession(handler), chunk_size=2
+                )
+            # cancelled before the error surfaced, not by asyncio.run's cleanup
+            self.assertEqual(len(cancelled), 2)
+
+        asyncio.run(main())
+
+    def test_401_refreshes_token_once(self):
+        async def handler(headers, data):
+            if headers["Authorization"] == "Bearer stale":
+                return _FakeAioResponse(401, b"")
+            return _FakeAioResponse(200, _batch_body(204, 204))
+
+        self.svc._set_token("stale", 2**40)
+        session = _FakeAioSession(handler)
+        with patch.object(self.svc, "_send", return_value=_token_response()) as send:
+            report = self._run(session, _options(2))
+        self.assertEqual(report.succeeded, 2)
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(
+            [h["Authorization"] for h in session.calls], ["Bearer stale", "Bearer tok"]
+        )
+
+    def test_401_twice_raises(self):
+        async def handler(headers, data):
+            return _FakeAioResponse(401, b"")
+
+        with patch.object(self.svc, "_send", return_value=_token_response()):
+            with self.assertRaises(RuntimeError):
+                self._run(_FakeAioSession(handler), _options(2))
+
+
+@unittest.skipUnless(httpx, "httpx not installed")
+class TestHttpxTransport(ServiceTestCase):
+    """The httpx transport must look like requests to the callers."""
+
+    def _use(self, handler):
+        self.svc._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_responses_and_errors_are_requests_types(self):
+        def handler(request):
+            if request.url.path.endswith("$batch"):
+                self.assertEqual(request.content, b"body")
+                return httpx.Response(500, content=b"boom", headers={"Retry-After": "1"})
+            return httpx.Response(200, json={"Name": "os"})
+
+        self._use(handler)
+        resp = self.svc._request("GET", "https://org.example.com/api/data/v9.2/x")
+        self.assertIsInstance(resp, requests.Response)
+        self.assertEqual(resp.json(), {"Name": "os"})
+        resp = self.svc._request(
+            "POST", "https://org.example.com/api/data/v9.2/$batch", data=b"body"
+        )
+        self.assertEqual(resp.headers["retry-after"], "1")
+        with self.assertRaises(requests.HTTPError):
+            resp.raise_for_status()
+
+    def test_transport_errors_are_mapped(self):
+        def handler(request):
+            if request.url.path == "/slow":
+                raise httpx.ReadTimeout("timed out", request=request)
+            raise httpx.ConnectError("refused", request=request)
+
+        self._use(handler)
+        with self.assertRaises(requests.Timeout):
+            self.svc._send("GET", "https://org.example.com/slow")
+        with self.assertRaises(requests.ConnectionError):
+            self.svc._send("GET", "https://org.example.com/down")
+
+
+if __name__ == "__main__":
+    unittest.main()